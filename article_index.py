@@ -0,0 +1,111 @@
+import sqlite3
+from datetime import datetime
+
+from news import News
+
+# The output modes of an indexed search: only the new articles, or new and indexed ones merged
+INDEX_MODES = ('new', 'full')
+
+
+class ArticleIndex:
+    """Persistent SQLite index of the articles scraped for each search phrase.
+
+    Articles are keyed by their link within a search phrase and keep the parsed
+    fields, the downloaded image and when they were first and last seen, so
+    repeated runs can skip what earlier runs already collected.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                search_phrase TEXT NOT NULL,
+                link TEXT NOT NULL,
+                title TEXT,
+                source TEXT,
+                time TEXT,
+                published TEXT,
+                description TEXT,
+                image_url TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                PRIMARY KEY (search_phrase, link)
+            )
+            """
+        )
+        self.connection.commit()
+
+    def links(self, search_phrase):
+        """Returns the set of links already indexed for a search phrase."""
+        rows = self.connection.execute('SELECT link FROM articles WHERE search_phrase = ?', (search_phrase,))
+        return {link for (link,) in rows}
+
+    def record(self, articles, search_phrase, seen_at):
+        """Adds new articles to the index and refreshes the ones already known.
+
+        Args:
+            articles (list): The enriched News objects to record.
+            search_phrase (str): The search phrase the articles were found for.
+            seen_at (datetime): When the articles were seen.
+        """
+        seen_at = seen_at.isoformat(sep=' ', timespec='seconds')
+        self.connection.executemany(
+            """
+            INSERT INTO articles (
+                search_phrase, link, title, source, time, published, description, image_url, first_seen, last_seen
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (search_phrase, link) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                image_url = CASE WHEN excluded.image_url != 'N/A' THEN excluded.image_url ELSE articles.image_url END
+            """,
+            [
+                (
+                    search_phrase,
+                    article.link,
+                    article.title,
+                    article.source,
+                    article.time,
+                    article.published.isoformat(sep=' ', timespec='seconds'),
+                    article.description,
+                    article.image_url,
+                    seen_at,
+                    seen_at,
+                )
+                for article in articles
+            ],
+        )
+        self.connection.commit()
+
+    def load(self, search_phrase, since=None, now=None):
+        """Loads the indexed articles of a search phrase, newest first.
+
+        Args:
+            search_phrase (str): The search phrase to load.
+            since (datetime): Only load articles published after this, or None for all.
+            now (datetime): The reference time used to enrich the loaded articles.
+
+        Returns:
+            list: Enriched News objects carrying their originally parsed publication time.
+        """
+        since = since.isoformat(sep=' ', timespec='seconds') if since is not None else ''
+        rows = self.connection.execute(
+            """
+            SELECT title, link, source, time, description, image_url, published FROM articles
+            WHERE search_phrase = ? AND published >= ?
+            ORDER BY published DESC
+            """,
+            (search_phrase, since),
+        )
+        now = now or datetime.now()
+        articles = []
+        for title, link, source, time, description, image_url, published in rows:
+            article = News(title, link, source, time, description, image_url)
+            article.enrich(now)
+            article.published = datetime.fromisoformat(published)
+            articles.append(article)
+        return articles
+
+    def close(self):
+        self.connection.close()
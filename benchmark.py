@@ -0,0 +1,364 @@
+"""Offline benchmarks for the news scraping pipeline.
+
+Usage:
+    python benchmark.py enrichment --articles 100000
+    python benchmark.py profiles --phrase "car sale increase" --runs 3
+    python benchmark.py pipeline --backend http --articles 500 --page-latency 0.05 --runs 5
+"""
+import os
+import argparse
+import json
+import random
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+from fixture_server import FixtureServer
+from news import News, enrich_articles
+
+TIME_UNITS = ['minute', 'hour', 'day', 'week', 'month']
+TITLE_WORDS = ['car', 'sale', 'increase', 'market', 'prices', 'dealers', 'electric', 'report', 'quarter']
+MONEY_PHRASES = ['$1,250.00', '$45.5', '300 dollars', '12 USD']
+
+
+def make_synthetic_articles(count, seed=0):
+    """Builds synthetic articles with realistic titles, descriptions and relative times."""
+    rng = random.Random(seed)
+    articles = []
+    for index in range(count):
+        title_words = rng.sample(TITLE_WORDS, 6)
+        if rng.random() < 0.2:
+            title_words.append(rng.choice(MONEY_PHRASES))
+        description_words = [rng.choice(TITLE_WORDS) for _ in range(30)]
+        if rng.random() < 0.3:
+            description_words.insert(rng.randrange(30), rng.choice(MONEY_PHRASES))
+        value = rng.randint(1, 11)
+        unit = rng.choice(TIME_UNITS)
+        articles.append(News(
+            title=' '.join(title_words).capitalize(),
+            link=f'https://example.com/news/{index}',
+            source='Example News',
+            time=f"· {value} {unit}{'s' if value > 1 else ''} ago",
+            description=' '.join(description_words),
+            image_url='N/A',
+        ))
+    return articles
+
+
+class _LegacyNews:
+    """The dict-backed article record the enrichment stage replaced."""
+
+    def __init__(self, title, link, source, time, description, image_url):
+        self.title = title
+        self.link = link
+        self.source = source
+        self.time = time
+        self.description = description
+        self.image_url = image_url
+
+
+def _legacy_contains_money(text):
+    money_patterns = [
+        r'\$\d{1,3}(,\d{3})*(\.\d{2})?',
+        r'\b\d{1,3}(,\d{3})*(\.\d{2})?\s+dollars?\b',
+        r'\b\d{1,3}(,\d{3})*(\.\d{2})?\s+USD\b'
+    ]
+    pattern = '|'.join(money_patterns)
+    return bool(re.search(pattern, text, re.IGNORECASE))
+
+
+def _legacy_relative_time_to_absolute(relative_time):
+    now = datetime.now()
+    match = re.match(r'·\s*(\d+)\s+(minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)\s+ago', relative_time)
+    if match:
+        value, unit = match.groups()
+        value = int(value)
+        if unit.startswith('minute'):
+            return now - timedelta(minutes=value)
+        elif unit.startswith('hour'):
+            return now - timedelta(hours=value)
+        elif unit.startswith('day'):
+            return now - timedelta(days=value)
+        elif unit.startswith('week'):
+            return now - timedelta(weeks=value)
+        elif unit.startswith('month'):
+            return now - timedelta(days=value * 30)
+        elif unit.startswith('year'):
+            return now - timedelta(days=value * 365)
+    return now
+
+
+def _legacy_pipeline(articles, months):
+    """Filters and builds output rows the way the pipeline did before enrichment."""
+    cutoff_date = datetime.now() - relativedelta(months=months)
+    articles = [article for article in articles if _legacy_relative_time_to_absolute(article.time) >= cutoff_date]
+    rows = []
+    for article in articles:
+        rows.append([
+            article.title,
+            len(article.title),
+            _legacy_contains_money(article.title),
+            article.link,
+            article.source,
+            _legacy_relative_time_to_absolute(article.time).strftime('%Y-%m-%d %H:%M:%S'),
+            article.description,
+            len(article.description),
+            _legacy_contains_money(article.description),
+            article.image_url,
+        ])
+    return rows
+
+
+def _enriched_pipeline(articles, months):
+    """Filters and builds output rows from one enrichment pass."""
+    now = datetime.now()
+    cutoff_date = now - relativedelta(months=months)
+    articles = [article for article in enrich_articles(articles, now) if article.published >= cutoff_date]
+    rows = []
+    for article in articles:
+        rows.append([
+            article.title,
+            article.title_length,
+            article.title_contains_money,
+            article.link,
+            article.source,
+            article.published.strftime('%Y-%m-%d %H:%M:%S'),
+            article.description,
+            article.description_length,
+            article.description_contains_money,
+            article.image_url,
+        ])
+    return rows
+
+
+def _measure(build, run):
+    """Returns the run time, the peak traced memory and the row count of processing the records.
+
+    Timing and memory tracing are done in separate runs so tracing overhead does not
+    skew the timings.
+    """
+    records = build()
+    start_time = time.perf_counter()
+    rows = run(records)
+    elapsed = time.perf_counter() - start_time
+    del records, rows
+
+    tracemalloc.start()
+    records = build()
+    rows = run(records)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(rows)
+
+
+def bench_enrichment(count=100_000, months=3, seed=0):
+    """Compares the legacy per-call parsing with the single-pass enrichment stage.
+
+    Returns:
+        dict: Seconds, articles per second and peak memory of both variants.
+    """
+    def build_legacy():
+        return [
+            _LegacyNews(a.title, a.link, a.source, a.time, a.description, a.image_url)
+            for a in make_synthetic_articles(count, seed)
+        ]
+
+    results = {'articles': count, 'months': months}
+    variants = [
+        ('legacy', build_legacy, _legacy_pipeline),
+        ('enriched', lambda: make_synthetic_articles(count, seed), _enriched_pipeline),
+    ]
+    for name, build, run in variants:
+        elapsed, peak, rows = _measure(build, lambda records: run(records, months))
+        results[name] = {
+            'seconds': round(elapsed, 4),
+            'articles_per_second': round(count / elapsed, 1),
+            'peak_memory_bytes': peak,
+            'rows': rows,
+        }
+    results['speedup'] = round(results['legacy']['seconds'] / results['enriched']['seconds'], 2)
+    return results
+
+
+def bench_browser_profiles(phrase, profiles=('fast', 'headless', 'full'), runs=3):
+    """Compares browser launch and results page-ready times between browser profiles.
+
+    Each run launches a fresh browser with the profile, opens the news search results
+    for the phrase and waits until the results list is visible.
+
+    Returns:
+        dict: Per profile, the launch and page-ready seconds of each run and their medians.
+    """
+    # Imported here so the offline benchmarks do not need the browser dependencies
+    from custom import CustomSelenium
+
+    results = {'phrase': phrase, 'runs': runs, 'profiles': {}}
+    for profile in profiles:
+        launch_times = []
+        ready_times = []
+        for _ in range(runs):
+            selenium = CustomSelenium(browser_profile=profile)
+            try:
+                selenium.waits.start()
+                start_time = time.perf_counter()
+                selenium.launch_browser('about:blank')
+                launched_time = time.perf_counter()
+                selenium.open_search_results(phrase, timeout=60)
+                ready_time = time.perf_counter()
+            finally:
+                selenium.close_browser()
+            launch_times.append(round(launched_time - start_time, 3))
+            ready_times.append(round(ready_time - launched_time, 3))
+        results['profiles'][profile] = {
+            'launch_seconds': launch_times,
+            'page_ready_seconds': ready_times,
+            'median_launch_seconds': statistics.median(launch_times),
+            'median_page_ready_seconds': statistics.median(ready_times),
+        }
+    return results
+
+
+def percentile(values, pct):
+    """Returns the nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _peak_rss_bytes():
+    """Returns the peak resident memory of this process and of its children (the browser)."""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None, None
+    # ru_maxrss is reported in kilobytes on Linux
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024,
+    )
+
+
+def bench_pipeline(backend='http', articles=100, per_page=10, page_latency=0.0, image_latency=0.0,
+                   image_size=8192, runs=3, months=12, output_format='xlsx', browser_profile='fast',
+                   pipelined=False):
+    """Runs the scraping pipeline against the local fixture server.
+
+    Every run starts from an empty output directory, so images are fetched cold.
+    With pipelined=True the scraper runs in its asyncio pipeline mode.
+
+    Returns:
+        dict: The configuration, per-run seconds, article throughput, p50/p95 latency
+        of every traced stage, mean counters per run and peak memory.
+    """
+    # Imported here so the offline benchmarks do not need the scraping dependencies
+    from custom import CustomSelenium
+    from http_backend import HttpNewsScraper
+
+    scraper_classes = {'selenium': CustomSelenium, 'http': HttpNewsScraper}
+    run_seconds = []
+    collected = []
+    stage_seconds = defaultdict(list)
+    counters = defaultdict(int)
+
+    server = FixtureServer(articles, per_page, page_latency, image_latency, image_size)
+    with server, tempfile.TemporaryDirectory() as output_dir:
+        for run in range(runs):
+            scraper = scraper_classes[backend](
+                search_url=server.search_url,
+                output_dir=os.path.join(output_dir, f'run-{run}'),
+                output_format=output_format,
+                browser_profile=browser_profile,
+                pipeline=pipelined,
+            )
+            start_time = time.perf_counter()
+            try:
+                scraper.search(server.url, 'benchmark', months)
+            finally:
+                scraper.close_browser()
+            run_seconds.append(time.perf_counter() - start_time)
+            collected.append(len(scraper.articles))
+            for span in scraper.tracer.spans:
+                stage_seconds[span.name].append(span.duration or 0)
+            for counter, value in scraper.tracer.totals().items():
+                counters[counter] += value
+
+    peak_rss, peak_children_rss = _peak_rss_bytes()
+    return {
+        'backend': backend,
+        'pipelined': pipelined,
+        'articles': articles,
+        'per_page': per_page,
+        'page_latency': page_latency,
+        'image_latency': image_latency,
+        'image_size': image_size,
+        'runs': runs,
+        'run_seconds': [round(seconds, 4) for seconds in run_seconds],
+        'articles_collected': collected,
+        'articles_per_second': round(sum(collected) / sum(run_seconds), 1),
+        'stages': {
+            name: {
+                'p50_seconds': round(percentile(values, 50), 4),
+                'p95_seconds': round(percentile(values, 95), 4),
+            }
+            for name, values in stage_seconds.items()
+        },
+        'counters_per_run': {counter: value / runs for counter, value in counters.items()},
+        'peak_rss_bytes': peak_rss,
+        'peak_children_rss_bytes': peak_children_rss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--output', help='Also write the results as JSON to this file.')
+
+    enrichment = subparsers.add_parser('enrichment', help='Article enrichment micro-benchmark.', parents=[common])
+    enrichment.add_argument('--articles', type=int, default=100_000)
+    enrichment.add_argument('--months', type=int, default=3)
+    enrichment.add_argument('--seed', type=int, default=0)
+
+    profiles = subparsers.add_parser('profiles', help='Browser profile page-ready benchmark (needs Chrome).', parents=[common])
+    profiles.add_argument('--phrase', default='car sale increase')
+    profiles.add_argument('--profiles', nargs='+', default=['fast', 'headless', 'full'])
+    profiles.add_argument('--runs', type=int, default=3)
+
+    pipeline = subparsers.add_parser('pipeline', help='Full pipeline against the local fixture server.', parents=[common])
+    pipeline.add_argument('--backend', choices=['http', 'selenium'], default='http')
+    pipeline.add_argument('--articles', type=int, default=100)
+    pipeline.add_argument('--per-page', type=int, default=10)
+    pipeline.add_argument('--page-latency', type=float, default=0.0)
+    pipeline.add_argument('--image-latency', type=float, default=0.0)
+    pipeline.add_argument('--image-size', type=int, default=8192)
+    pipeline.add_argument('--runs', type=int, default=3)
+    pipeline.add_argument('--months', type=int, default=12)
+    pipeline.add_argument('--output-format', default='xlsx')
+    pipeline.add_argument('--browser-profile', default='fast')
+    pipeline.add_argument('--pipelined', action='store_true', help='Run the scraper in its asyncio pipeline mode.')
+
+    args = parser.parse_args()
+    if args.benchmark == 'enrichment':
+        results = bench_enrichment(args.articles, args.months, args.seed)
+    elif args.benchmark == 'profiles':
+        results = bench_browser_profiles(args.phrase, args.profiles, args.runs)
+    elif args.benchmark == 'pipeline':
+        results = bench_pipeline(
+            args.backend, args.articles, args.per_page, args.page_latency, args.image_latency,
+            args.image_size, args.runs, args.months, args.output_format, args.browser_profile,
+            args.pipelined,
+        )
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
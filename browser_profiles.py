@@ -0,0 +1,135 @@
+import os
+import copy
+import atexit
+import shutil
+import tempfile
+
+from selenium.webdriver.chrome.options import Options
+
+BLOCKED_URL_PATTERNS = {
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf'],
+    'media': ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.m4a'],
+    'ads': [
+        '*doubleclick.net*',
+        '*googlesyndication.com*',
+        '*googletagservices.com*',
+        '*adservice.google.com*',
+        '*amazon-adsystem.com*',
+        '*advertising.com*',
+        '*ads.yahoo.com*',
+        '*analytics.yahoo.com*',
+    ],
+}
+
+USER_DATA_DIR_PREFIX = os.path.join(tempfile.gettempdir(), 'yahoo-news-chrome-profile')
+# Chrome locks its user data directory, so every robot process gets its own
+DEFAULT_USER_DATA_DIR = f"{USER_DATA_DIR_PREFIX}-{os.getpid()}"
+
+
+class BrowserProfile:
+    """Chrome launch settings applied by CustomSelenium.launch_browser.
+
+    Args:
+        name (str): The profile name.
+        headless (bool): Whether to run Chrome without a window.
+        block_images (bool): Whether to disable image loading.
+        block (tuple): Resource groups of BLOCKED_URL_PATTERNS to block ('fonts', 'media', 'ads').
+        page_load_strategy (str): 'normal', 'eager' (DOM ready) or 'none'.
+        disable_extensions (bool): Whether to disable browser extensions.
+        user_data_dir (str): A user data directory reused across the searches of a process for its cache, or None.
+    """
+
+    def __init__(self, name, headless=True, block_images=True, block=('fonts', 'media', 'ads'),
+                 page_load_strategy='eager', disable_extensions=True, user_data_dir=None):
+        self.name = name
+        self.headless = headless
+        self.block_images = block_images
+        self.block = tuple(block)
+        self.page_load_strategy = page_load_strategy
+        self.disable_extensions = disable_extensions
+        self.user_data_dir = user_data_dir
+
+    def arguments(self):
+        """Returns the Chrome command line arguments of the profile, except the user data directory."""
+        arguments = ["--window-size=1920,1080", "--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"]
+        if self.disable_extensions:
+            arguments.append("--disable-extensions")
+        return arguments
+
+    def options(self):
+        """Builds the Chrome options of the profile."""
+        options = Options()
+        options.page_load_strategy = self.page_load_strategy
+        for argument in self.arguments():
+            options.add_argument(argument)
+        if self.user_data_dir:
+            options.add_argument(f"--user-data-dir={self.user_data_dir}")
+        if self.block_images:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        return options
+
+    def attach_options(self, debugger_address):
+        """Builds the Chrome options attaching to a running browser, such as one of a BrowserService.
+
+        Launch settings do not apply to a running browser; BrowserService starts
+        Chrome with the profile's arguments instead.
+        """
+        options = Options()
+        options.page_load_strategy = self.page_load_strategy
+        options.debugger_address = debugger_address
+        return options
+
+    def for_worker(self, worker_id):
+        """Returns a copy of the profile with its own user data directory for a worker process.
+
+        Chrome locks its user data directory, so concurrent browsers cannot share one.
+        """
+        profile = copy.copy(self)
+        if self.user_data_dir:
+            profile.user_data_dir = f"{self.user_data_dir}-{worker_id}"
+        return profile
+
+    def blocked_urls(self):
+        """Returns the URL patterns blocked by the profile."""
+        return [pattern for group in self.block for pattern in BLOCKED_URL_PATTERNS[group]]
+
+    def apply(self, driver):
+        """Applies the settings that can only be set on a running browser, like URL blocking.
+
+        URL blocking needs CDP, which remote WebDriver sessions do not expose.
+        """
+        blocked_urls = self.blocked_urls()
+        if blocked_urls and hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+
+
+BROWSER_PROFILES = {
+    # Headless, no images, fonts, media or ads, DOM-ready page loads and a profile cached for the process
+    'fast': BrowserProfile('fast', user_data_dir=DEFAULT_USER_DATA_DIR),
+    # Headless but otherwise a regular browser
+    'headless': BrowserProfile(
+        'headless', block_images=False, block=(), page_load_strategy='normal', disable_extensions=False
+    ),
+    # A regular, visible browser, as used before profiles existed
+    'full': BrowserProfile(
+        'full', headless=False, block_images=False, block=(), page_load_strategy='normal', disable_extensions=False
+    ),
+}
+
+
+# The per-process directory cannot be reused by a later run, so do not leave it behind
+atexit.register(shutil.rmtree, DEFAULT_USER_DATA_DIR, ignore_errors=True)
+
+
+def get_browser_profile(profile):
+    """Returns a BrowserProfile given a profile or the name of one of BROWSER_PROFILES.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    if isinstance(profile, BrowserProfile):
+        return profile
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile: {profile}")
+    return BROWSER_PROFILES[profile]
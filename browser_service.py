@@ -0,0 +1,260 @@
+"""Long-lived Chrome instances that robot runs attach to instead of launching their own.
+
+The browsers (and, if available, one chromedriver) keep running between robot
+invocations, so a short scheduled search skips the browser and driver startup and
+keeps its cookies and cache. The pool is shared through a JSON state file in the
+temporary directory, guarded by a lock file.
+"""
+import os
+import json
+import time
+import shutil
+import signal
+import logging
+import tempfile
+import subprocess
+from contextlib import contextmanager
+from urllib.request import urlopen
+
+from browser_profiles import USER_DATA_DIR_PREFIX, get_browser_profile
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome', 'msedge')
+STATE_PATH_PREFIX = os.path.join(tempfile.gettempdir(), 'yahoo-news-browser-service')
+
+# Each profile's browsers get their own port range, so services of different profiles never share a browser
+BASE_PORTS = {'fast': 9300, 'headless': 9320, 'full': 9340}
+DEFAULT_BASE_PORT = 9360
+
+# The settings a work item payload may choose; the others stay under the robot's control
+PAYLOAD_SETTINGS = ('size', 'max_uses', 'base_port', 'lease_seconds')
+
+
+class BrowserLease:
+    """A browser of the pool handed out to one run until it is released."""
+
+    def __init__(self, port, debugger_address, remote_url=None):
+        self.port = port
+        self.debugger_address = debugger_address
+        self.remote_url = remote_url
+
+
+class BrowserService:
+    """A pool of pre-warmed Chrome instances reused across robot runs.
+
+    Each browser listens on its own remote debugging port and keeps its own user
+    data directory. The state file and the ports are derived from the profile name,
+    and every browser records the profile it was started with, so a service never
+    hands out a browser started with another profile's flags.
+
+    acquire hands out a browser that is not leased to another run, first checking
+    it answers on /json/version and restarting it if it does not or if it has
+    served max_uses runs, which keeps leaks of long-lived browsers in check. A lease expires after lease_seconds, so a run that crashed without
+    releasing its browser does not block it forever.
+
+    Args:
+        profile (str or BrowserProfile): The browser profile the browsers are started with.
+        size (int): The number of browsers in the pool.
+        max_uses (int): The number of runs after which a browser is restarted.
+        base_port (int): The debugging port of the first browser; the others follow it.
+            Defaults to the profile's entry in BASE_PORTS.
+        driver_port (int): The port of the shared chromedriver, by default base_port - 1.
+        state_path (str): The path of the JSON state file, by default one per profile.
+        chrome_binary (str): The Chrome executable, found on the PATH by default.
+        chromedriver (str): The chromedriver executable, found on the PATH by default.
+            Without one, runs start their own driver and only the browser is reused.
+        lease_seconds (float): How long a browser stays leased to a run at most.
+        startup_timeout (float): Seconds to wait for a started browser or driver to answer.
+    """
+
+    def __init__(self, profile='fast', size=2, max_uses=20, base_port=None, driver_port=None,
+                 state_path=None, chrome_binary=None, chromedriver=None,
+                 lease_seconds=1800, startup_timeout=30):
+        self.logger = logging.getLogger(__name__)
+        self.profile = get_browser_profile(profile)
+        self.size = size
+        self.max_uses = max_uses
+        self.base_port = base_port or BASE_PORTS.get(self.profile.name, DEFAULT_BASE_PORT)
+        self.driver_port = driver_port or self.base_port - 1
+        self.state_path = state_path or f"{STATE_PATH_PREFIX}-{self.profile.name}.json"
+        self.lock_path = f"{self.state_path}.lock"
+        self.chrome_binary = chrome_binary
+        self.chromedriver = chromedriver if chromedriver is not None else shutil.which('chromedriver')
+        self.lease_seconds = lease_seconds
+        self.startup_timeout = startup_timeout
+
+    @contextmanager
+    def _locked_state(self, timeout=None):
+        """Yields the pool state under an exclusive lock and writes it back afterwards."""
+        # The lock is held while browsers start, so wait for longer than a few startups
+        timeout = timeout or 3 * self.startup_timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                lock = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                # A lock older than the timeout was left behind by a crashed run
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > timeout:
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for the browser service lock {self.lock_path}")
+                time.sleep(0.05)
+        try:
+            try:
+                with open(self.state_path, encoding='utf-8') as file:
+                    state = json.load(file)
+            except (FileNotFoundError, ValueError):
+                state = {}
+            yield state
+            temp_path = f"{self.state_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(state, file, indent=2)
+            os.replace(temp_path, self.state_path)
+        finally:
+            os.close(lock)
+            os.remove(self.lock_path)
+
+    @staticmethod
+    def _get_json(url, timeout=2):
+        """Returns the JSON answer of a local endpoint, or None if it does not answer."""
+        try:
+            with urlopen(url, timeout=timeout) as response:
+                return json.load(response)
+        except (OSError, ValueError):
+            return None
+
+    def browser_healthy(self, port):
+        """Returns True if the browser on the debugging port answers /json/version."""
+        version = self._get_json(f"http://127.0.0.1:{port}/json/version")
+        return bool(version and version.get('Browser'))
+
+    def driver_healthy(self):
+        """Returns True if the shared chromedriver reports it is ready."""
+        status = self._get_json(f"http://127.0.0.1:{self.driver_port}/status")
+        return bool(status and status.get('value', {}).get('ready'))
+
+    def find_chrome(self):
+        """Returns the Chrome executable to start.
+
+        Raises:
+            FileNotFoundError: If no Chrome executable is found.
+        """
+        if self.chrome_binary:
+            return self.chrome_binary
+        for name in CHROME_BINARIES:
+            path = shutil.which(name)
+            if path:
+                return path
+        raise FileNotFoundError(f"No Chrome executable found on the PATH (tried {', '.join(CHROME_BINARIES)})")
+
+    def _spawn(self, command):
+        """Starts a process detached from the robot run, so it outlives it."""
+        kwargs = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL, 'stdin': subprocess.DEVNULL}
+        if os.name == 'nt':
+            kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs['start_new_session'] = True
+        return subprocess.Popen(command, **kwargs).pid
+
+    def _wait_until(self, condition, description):
+        """Polls the condition until it holds or the startup timeout passes."""
+        deadline = time.monotonic() + self.startup_timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{description} did not complete within {self.startup_timeout} seconds")
+            time.sleep(0.2)
+
+    def _kill(self, pid):
+        if not pid:
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+    def _start_browser(self, port):
+        """Starts a browser on the debugging port and returns its process id."""
+        user_data_dir = f"{USER_DATA_DIR_PREFIX}-service-{self.profile.name}-{port}"
+        command = [self.find_chrome()] + self.profile.arguments() + [
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if self.profile.headless:
+            command.append("--headless=new")
+        if self.profile.block_images:
+            command.append("--blink-settings=imagesEnabled=false")
+        pid = self._spawn(command)
+        self._wait_until(lambda: self.browser_healthy(port), f"Starting the browser on port {port}")
+        self.logger.info(f"Started browser {pid} on debugging port {port}.")
+        return pid
+
+    def _ensure_driver(self, state):
+        """Starts the shared chromedriver unless it is running; returns its URL or None."""
+        if not self.chromedriver:
+            return None
+        if not self.driver_healthy():
+            self._kill(state.get('driver_pid'))
+            state['driver_pid'] = self._spawn([self.chromedriver, f"--port={self.driver_port}"])
+            self._wait_until(self.driver_healthy, f"Starting chromedriver on port {self.driver_port}")
+            self.logger.info(f"Started chromedriver {state['driver_pid']} on port {self.driver_port}.")
+        return f"http://127.0.0.1:{self.driver_port}"
+
+    def acquire(self):
+        """Leases a healthy browser of the pool to the calling run.
+
+        Returns:
+            BrowserLease: The debugging address and, with a shared chromedriver, its URL.
+
+        Raises:
+            RuntimeError: If every browser of the pool is leased to another run, or if a
+                port of the pool is taken by a browser the service did not start.
+        """
+        with self._locked_state() as state:
+            slots = state.setdefault('browsers', {})
+            now = time.time()
+            for port in range(self.base_port, self.base_port + self.size):
+                slot = slots.setdefault(str(port), {'pid': None, 'profile': None, 'uses': 0, 'leased_until': 0})
+                if slot['leased_until'] > now:
+                    continue
+                if slot.get('profile') != self.profile.name:
+                    if not slot['pid'] and self.browser_healthy(port):
+                        raise RuntimeError(f"Port {port} is used by a browser the service did not start")
+                    reason = f"restarting with the '{self.profile.name}' profile"
+                elif slot['uses'] >= self.max_uses:
+                    reason = 'recycling'
+                elif not self.browser_healthy(port):
+                    reason = 'starting'
+                else:
+                    reason = None
+                if reason:
+                    self.logger.info(f"Browser on port {port}: {reason} after {slot['uses']} uses.")
+                    if slot['pid']:
+                        # Let the old browser free the port before starting the new one
+                        self._kill(slot['pid'])
+                        self._wait_until(lambda: not self.browser_healthy(port), f"Stopping the browser on port {port}")
+                    slot.update(pid=self._start_browser(port), profile=self.profile.name, uses=0)
+                slot['uses'] += 1
+                slot['leased_until'] = now + self.lease_seconds
+                remote_url = self._ensure_driver(state)
+                return BrowserLease(port, f"127.0.0.1:{port}", remote_url)
+        raise RuntimeError(f"All {self.size} browsers of the service are in use")
+
+    def release(self, lease):
+        """Returns a leased browser to the pool."""
+        with self._locked_state() as state:
+            slot = state.get('browsers', {}).get(str(lease.port))
+            if slot:
+                slot['leased_until'] = 0
+
+    def stop(self):
+        """Stops every browser of the pool and the shared chromedriver."""
+        with self._locked_state() as state:
+            for slot in state.pop('browsers', {}).values():
+                self._kill(slot['pid'])
+            self._kill(state.pop('driver_pid', None))
@@ -0,0 +1,110 @@
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime, timedelta
+
+# The stages of a search, in order; a checkpoint records the last one completed
+STAGES = ('collecting', 'collected', 'images', 'indexed')
+
+
+class Checkpoint:
+    """The progress of one search, saved as JSON so a retry can resume it.
+
+    A checkpoint holds the last stage reached, the reference time of the run, the
+    URL of the next results page to collect, the articles extracted so far and the
+    image downloads already completed. It is identified by a key describing the
+    search, so a checkpoint of a different search is never resumed.
+
+    Args:
+        path (str): The path of the checkpoint file.
+        key (dict): The search parameters the checkpoint belongs to.
+        max_age (float): Seconds after which a checkpoint is considered stale and ignored.
+    """
+
+    def __init__(self, path, key, max_age=3600):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.key = key
+        self.max_age = max_age
+        self.stage = None
+        self.reference_time = None
+        self.results_url = None
+        self.articles = []
+        self.downloads = {}
+
+    @classmethod
+    def for_search(cls, directory, key, **kwargs):
+        """Returns the checkpoint of a search, stored in the given directory under a name derived from its key."""
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        return cls(os.path.join(directory, f"checkpoint_{digest}.json"), key, **kwargs)
+
+    def load(self):
+        """Loads the checkpoint file if it exists, belongs to this search and is not stale.
+
+        Returns:
+            bool: True if a checkpoint was loaded.
+        """
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return False
+        except ValueError as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return False
+
+        if data.get('key') != self.key or data.get('stage') not in STAGES:
+            return False
+        reference_time = datetime.fromisoformat(data['reference_time'])
+        if datetime.now() - reference_time > timedelta(seconds=self.max_age):
+            self.logger.info(f"Ignoring stale checkpoint from {reference_time}: {self.path}")
+            return False
+
+        self.stage = data['stage']
+        self.reference_time = reference_time
+        self.results_url = data.get('results_url')
+        self.articles = data.get('articles', [])
+        self.downloads = data.get('downloads', {})
+        return True
+
+    def reached(self, stage):
+        """Returns True if the given stage was completed."""
+        return self.stage is not None and STAGES.index(self.stage) >= STAGES.index(stage)
+
+    def save(self, stage, reference_time, articles, results_url=None, downloads=None):
+        """Records the progress of the search, replacing the checkpoint file atomically.
+
+        Args:
+            stage (str): The last stage completed, one of STAGES.
+            reference_time (datetime): The reference time of the run.
+            articles (list): The News objects extracted so far.
+            results_url (str): The URL of the next results page to collect, if any.
+            downloads (dict): The completed image downloads, by image URL.
+        """
+        self.stage = stage
+        self.reference_time = reference_time
+        self.results_url = results_url
+        self.articles = [article.to_dict() for article in articles]
+        if downloads is not None:
+            self.downloads = dict(downloads)
+        data = {
+            'key': self.key,
+            'stage': self.stage,
+            'reference_time': self.reference_time.isoformat(),
+            'results_url': self.results_url,
+            'articles': self.articles,
+            'downloads': self.downloads,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        """Deletes the checkpoint file once the search has completed."""
+        self.stage = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -1,52 +1,117 @@
 # from RPA.core.webdriver import download, start
 import os
-import re
-import requests
-import time
+import json
+import asyncio
 import logging
 from datetime import datetime
-from RPA.Excel.Files import Files
+from collections import Counter
+from concurrent.futures import Future
+from urllib.parse import urlencode
 from RPA.Browser.Selenium import Selenium
 from selenium.webdriver.common.by import By
 from robocorp.tasks import get_output_dir
-from datetime import datetime, timedelta
 from selenium.common.exceptions import NoSuchElementException
 from dateutil.relativedelta import relativedelta
-from selenium.webdriver.chrome.options import Options
-
-def create_headless_options():
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    
-    return options
+from downloader import ImageDownloader, ImageStore
+from waits import WaitScheduler
+from news import News, contains_money, enrich_articles, relative_time_to_absolute
+from outputs import create_writer, unique_output_path
+from pipeline import ArticlePipeline
+from article_index import ArticleIndex
+from checkpoint import Checkpoint
+from browser_profiles import get_browser_profile
+from tracing import Tracer, count_webdriver_commands
+from results_parser import (
+    ARTICLES_XPATH,
+    DESCRIPTION_XPATH,
+    IMAGE_XPATH,
+    NEXT_PAGE_XPATH,
+    RESULTS_XPATH,
+    SOURCE_XPATH,
+    TIME_XPATH,
+    TITLE_XPATH,
+)
+
+NEWS_SEARCH_URL = 'https://news.search.yahoo.com/search'
 
+# Reads the fields of every article on the results page in a single WebDriver call.
+BATCH_EXTRACTION_SCRIPT = """
+const [articlesXpath, xpaths] = arguments;
+const first = (context, xpath) => document.evaluate(
+    xpath, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const text = (context, xpath) => {
+    const node = first(context, xpath);
+    return node ? node.innerText : null;
+};
+// Lazy-loaded images keep a placeholder in src and the real URL in data-src
+const imageUrl = (image) => {
+    const src = image.getAttribute('src');
+    if (src && src.startsWith('http')) {
+        return src;
+    }
+    return image.getAttribute('data-src') || src;
+};
+const elements = document.evaluate(
+    articlesXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const articles = [];
+for (let i = 0; i < elements.snapshotLength; i++) {
+    const element = elements.snapshotItem(i);
+    const title = first(element, xpaths.title);
+    const image = first(element, xpaths.image);
+    articles.push({
+        title: title ? title.getAttribute('title') : null,
+        link: title ? title.href : null,
+        source: text(element, xpaths.source),
+        time: text(element, xpaths.time),
+        description: text(element, xpaths.description),
+        image_url: image ? imageUrl(image) : null,
+    });
+}
+return JSON.stringify(articles);
+"""
 
-class News:
-    def __init__(self, title, link, source, time, description, image_url):
-        self.title = title
-        self.link = link
-        self.source = source
-        self.time = time
-        self.description = description
-        self.image_url = image_url
 
-    def __repr__(self):
-        return f"News(title={self.title}, link={self.link}, source={self.source}, time={self.time}, description={self.description}, image_url={self.image_url})"
+def build_news_search_url(word, search_url=NEWS_SEARCH_URL):
+    """Builds the Yahoo News search results URL for a keyword."""
+    return f"{search_url}?{urlencode({'p': word})}"
 
 
 class CustomSelenium:
-    def __init__(self):
+    def __init__(self, batch_extraction=True, navigation='direct', wait_budget=300, output_format='xlsx',
+                 index_mode=None, index_path=None, browser_profile='fast', search_url=NEWS_SEARCH_URL,
+                 output_dir=None, pipeline=False, queue_size=64, checkpoints=True, browser_service=None):
         self.driver = None
         self.logger = logging.getLogger(__name__)
         self.browser = Selenium(auto_close=False)
+        self.browser_open = False
         self.articles = []
-        self.pictures_dir = os.path.join(get_output_dir(), 'pictures')
+        self.reference_time = None
+        self.batch_extraction = batch_extraction
+        self.navigation = navigation
+        self.search_url = search_url
+        self.output_dir = str(output_dir or get_output_dir())
+        self.output_format = output_format
+        self.pipeline = pipeline
+        self.queue_size = queue_size
+        self.index_mode = index_mode
+        self.browser_profile = get_browser_profile(browser_profile)
+        self.browser_service = browser_service
+        self.browser_lease = None
+        self.index_path = index_path or os.path.join(self.output_dir, 'article_index.sqlite3')
+        self.index = None
+        self.known_links = set()
+        self.waits = WaitScheduler(budget=wait_budget)
+        self.tracer = Tracer()
+        self.pictures_dir = os.path.join(self.output_dir, 'pictures')
         if not os.path.exists(self.pictures_dir):
             os.makedirs(self.pictures_dir)
+        self.downloader = ImageDownloader(ImageStore(self.pictures_dir))
+        self.downloader.on_bytes = lambda size: self.tracer.count('image_bytes', size)
+        self.image_jobs = []
+        self.sinks = []  # Writers also receiving every saved article, such as a WorkItemPublisher
+        self.checkpoints = checkpoints
+        self.checkpoint = None
+        self.completed_downloads = {}
         
     def ensure_directory_permissions(self, path):
         """Ensures the specified directory is writable."""
@@ -54,28 +119,6 @@ class CustomSelenium:
             self.logger.error(f"Directory {path} is not writable.")
             raise PermissionError(f"Directory {path} is not writable.")
 
-    @staticmethod
-    def download_image(url, save_path):
-        """
-        Downloads an image from the specified URL and saves it to the given path.
-
-        :param url: URL of the image to be downloaded.
-        :param save_path: Local path to save the downloaded image.
-        :return: True if the image was downloaded successfully, False otherwise.
-        """
-        try:
-            response = requests.get(url, stream=True)
-            if response.status_code == 200:
-                with open(save_path, 'wb') as file:
-                    for chunk in response.iter_content(1024):
-                        file.write(chunk)
-                return True
-            else:
-                return False
-        except Exception as e:
-            print(f"Error downloading image: {e}")
-            return False
-    
     def ensure_directory_exists(self, path):
         """Ensures the specified directory exists, creates it if not."""
         try:
@@ -95,25 +138,17 @@ class CustomSelenium:
         xpath = 'xpath://body//a[contains(@class, "d-ib") and contains(text(),"News")]'
         attempts = 3  # Number of attempts to try finding and clicking the element
 
-        for attempt in range(1, attempts + 1):
-            try:
-                self.browser.wait_until_element_is_visible(
-                    xpath, timeout='30s', error='Element "News" not visible after 30 seconds.'
-                )
-                self.browser.wait_until_element_is_enabled(
-                    xpath, timeout='30s', error='Element "News" not clickable after 30 seconds.'
-                )
-                self.logger.info('Element "News" found and clickable. Clicking on the element.')
-                self.browser.click_element(xpath)
-                return  # Exit the function if successful
-            except Exception as e:
-                self.logger.error(f"Attempt {attempt} - Failed to find and click 'News' element: {e}")
-                if attempt < attempts:
-                    self.logger.info(f"Retrying... ({attempt}/{attempts})")
-                    time.sleep(5)  # Wait a bit before retrying
-                else:
-                    self.logger.error("Exceeded maximum attempts to find and click 'News' element.")
-                    raise  # Re-raise the last exception
+        def click_news_link():
+            self.waits.wait_until(
+                lambda: self.browser.is_element_visible(xpath) and self.browser.is_element_enabled(xpath),
+                timeout=30,
+                description='"News" link clickable',
+                error='Element "News" not clickable after 30 seconds.',
+            )
+            self.logger.info('Element "News" found and clickable. Clicking on the element.')
+            self.browser.click_element(xpath)
+
+        self.waits.retry(click_news_link, attempts=attempts, initial_interval=1, description='click "News" link')
     
     def filter_articles_by_date(self, months):
         """Filters articles based on the specified number of months.
@@ -124,43 +159,199 @@ class CustomSelenium:
         This method filters the self.articles list to only include articles from the specified
         number of months.
         """
-        cutoff_date = datetime.now() - relativedelta(months=months)
-        filtered_articles = [article for article in self.articles if self.relative_time_to_absolute(article.time) >= cutoff_date]
-        self.articles = filtered_articles
+        now = self.reference_time or datetime.now()
+        cutoff_date = now - relativedelta(months=months)
+        enrich_articles(self.articles, now)
+        self.articles = [article for article in self.articles if article.published >= cutoff_date]
+
+    def collect_articles(self, months=None, max_articles=None):
+        """Collects articles from the Yahoo News search results pages.
+
+        This method consumes iter_articles and stores the extracted articles in the
+        self.articles list. With a checkpoint, the progress is saved after every page.
+
+        Args:
+            months (int): Stop paging once articles are older than this many months.
+            max_articles (int): The maximum number of articles to collect.
+        """
+        for article in self.iter_articles(months=months, max_articles=max_articles):
+            self.articles.append(article)
 
-    def collect_articles(self):
-        """Collects articles from the Yahoo News search results page.
+    def iter_articles(self, months=None, max_articles=None, schedule_images=True):
+        """Yields articles from the search results, following the "Next" pagination.
 
-        This method locates and extracts information from news articles on the search results page,
-        including the title, link, source, time, description, and image.
+        Results are listed newest first, so paging stops after the first page that
+        contains an article older than the cutoff, or as soon as max_articles
+        articles have been yielded. Articles older than the cutoff are not yielded.
 
-        The extracted data is stored in the self.articles list.
+        The date cutoff and the limit are applied before any image is fetched: an
+        article's image download is only scheduled once the article is yielded, and
+        not at all when schedule_images is False.
 
-        Raises:
-            NoSuchElementException: If an expected element is not found on the page.
+        Articles whose link is in self.known_links (already indexed) are skipped,
+        and paging stops at the first page holding only known articles.
+
+        Args:
+            months (int): The number of months to include, or None for no cutoff.
+            max_articles (int): The maximum number of articles to yield, or None for no limit.
+            schedule_images (bool): Whether to schedule the image downloads of the yielded articles.
+
+        Yields:
+            News: The articles in the order they appear on the results pages.
+        """
+        now = self.reference_time or datetime.now()
+        cutoff_date = now - relativedelta(months=months) if months is not None else None
+        count = 0
+        page = 1
+        while True:
+            limit = max_articles - count if max_articles is not None else None
+            articles, reached_cutoff = self.extract_page_articles(now, cutoff_date, limit)
+            new_articles = [article for article in articles if article.link not in self.known_links]
+            for article in new_articles:
+                if schedule_images:
+                    self.schedule_image_download(article, article.image_source)
+                yield article
+                count += 1
+                if max_articles is not None and count >= max_articles:
+                    self.logger.info(f"Reached the limit of {max_articles} articles on page {page}.")
+                    return
+            if reached_cutoff:
+                self.logger.info(f"Reached articles older than {months} months on page {page}.")
+                return
+            if articles and not new_articles:
+                self.logger.info(f"Every article on page {page} is already indexed.")
+                return
+            if not self.go_to_next_page():
+                self.logger.info(f"No more result pages after page {page}.")
+                return
+            page += 1
+            self.save_checkpoint('collecting', results_url=self.current_results_url())
+
+    def go_to_next_page(self):
+        """Opens the next search results page.
+
+        Returns:
+            bool: True if a next page was opened, False if this is the last page.
         """
-        articles_xpath = 'xpath://ol[@class="mb-15 reg searchCenterMiddle"]//li//div[@class="dd NewsArticle"]'
-        elements = self.browser.get_webelements(articles_xpath)
+        next_links = self.browser.get_webelements(f'xpath:{NEXT_PAGE_XPATH}')
+        if not next_links:
+            return False
+        next_url = next_links[0].get_attribute('href')
+        if not next_url or next_url == self.browser.get_location():
+            return False
+        self.logger.info(f"Opening next results page: {next_url}")
+        self.browser.go_to(next_url)
+        self.wait_for_element_to_be_visible(f'xpath:{RESULTS_XPATH}', timeout=60)
+        return True
+
+    def extract_page_articles(self, now, cutoff_date=None, limit=None):
+        """Extracts the articles listed on the current search results page.
+
+        When batch extraction is enabled, every article is read in a single script call;
+        if that fails, the articles are extracted element by element instead. In that
+        case the time of each article is read first, and the other fields are only
+        read for articles that pass the cutoff and fit within the limit.
+
+        Args:
+            now (datetime): The reference time the article times are resolved against.
+            cutoff_date (datetime): Articles published before this are skipped, or None.
+            limit (int): The maximum number of articles to return, or None for no limit.
+
+        Returns:
+            tuple: The enriched News objects that passed the cutoff, and whether any
+            article on the page was older than the cutoff.
+        """
+        if self.batch_extraction:
+            try:
+                articles_data = self.extract_articles_batch()
+            except Exception as e:
+                self.logger.warning(f"Batch extraction failed, falling back to per-element extraction: {e}")
+            else:
+                return self.select_articles(self.build_articles(articles_data), now, cutoff_date, limit)
+
+        articles = []
+        reached_cutoff = False
+        elements = self.browser.get_webelements(f'xpath:{ARTICLES_XPATH}')
 
         if not elements:
             self.logger.info("No articles found.")
-            return
+            return articles, reached_cutoff
 
         for element in elements:
+            if limit is not None and len(articles) >= limit:
+                break
             try:
-                article = self.extract_article_data(element)
-                self.articles.append(article)
+                time = self.get_element_text(element, TIME_XPATH)
+                if cutoff_date is not None and self.relative_time_to_absolute(time or 'N/A', now) < cutoff_date:
+                    reached_cutoff = True
+                    continue
+                article = self.extract_article_data(element, time=time)
+                article.enrich(now)
+                articles.append(article)
             except Exception as e:
                 self.logger.error(f"Error extracting article data: {e}")
+        return articles, reached_cutoff
+
+    @staticmethod
+    def select_articles(articles, now, cutoff_date=None, limit=None):
+        """Enriches the articles and keeps those that pass the cutoff, up to the limit.
+
+        Returns:
+            tuple: The selected articles, and whether any article was older than the cutoff.
+        """
+        selected = []
+        reached_cutoff = False
+        for article in articles:
+            article.enrich(now)
+            if cutoff_date is not None and article.published < cutoff_date:
+                reached_cutoff = True
+            elif limit is None or len(selected) < limit:
+                selected.append(article)
+        return selected, reached_cutoff
+
+    def build_articles(self, articles_data):
+        """Builds News objects from a list of extracted article dicts, skipping incomplete ones."""
+        articles = []
+        if not articles_data:
+            self.logger.info("No articles found.")
+        for data in articles_data:
+            if not data.get('title') or not data.get('link'):
+                self.logger.error(f"Error extracting article data: missing title or link in {data}")
+                continue
+            articles.append(self.build_article(data))
+        return articles
+
+    def extract_articles_batch(self):
+        """Reads the fields of all articles on the page with one execute_script call.
+
+        Returns:
+            list: One dict per article with title, link, source, time, description
+            and image_url keys.
+
+        Raises:
+            ValueError: If the script does not return a JSON array.
+        """
+        xpaths = {
+            'title': TITLE_XPATH,
+            'source': SOURCE_XPATH,
+            'time': TIME_XPATH,
+            'description': DESCRIPTION_XPATH,
+            'image': IMAGE_XPATH,
+        }
+        result = self.browser.driver.execute_script(BATCH_EXTRACTION_SCRIPT, ARTICLES_XPATH, xpaths)
+        articles_data = json.loads(result)
+        if not isinstance(articles_data, list):
+            raise ValueError(f"Unexpected batch extraction result: {result!r}")
+        return articles_data
 
     def retry_action(self, func, retries=3, delay=2):
         """
-        Attempts to execute the provided function multiple times with a delay between attempts.
+        Attempts to execute the provided function multiple times, backing off between attempts.
 
         Args:
             func (function): The function to attempt.
             retries (int): Number of retries in case of failure.
-            delay (int): Delay in seconds between attempts.
+            delay (int): Initial delay in seconds between attempts; it grows with each retry.
 
         Returns:
             The result of the function if successful.
@@ -168,35 +359,16 @@ class CustomSelenium:
         Raises:
             Exception: If the function fails after the specified number of retries.
         """
-        start_time = time.time()
-        for attempt in range(1, retries + 1):
-            try:
-                self.logger.info(f"Attempt {attempt} of {retries} for function {func.__name__}.")
-                result = func()
-                end_time = time.time()
-                self.logger.info(f"Attempt {attempt} successful after {end_time - start_time:.2f} seconds.")
-                return result
-            except Exception as e:
-                self.logger.error(f"Error on attempt {attempt} for function {func.__name__}: {e}")
-                if attempt < retries:
-                    self.logger.info(f"Retrying after {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    self.logger.error(f"All {retries} attempts failed for function {func.__name__}.")
-                    raise Exception(f"Action {func.__name__} failed after {retries} retries.") from e
-        end_time = time.time()
-        self.logger.info(f"Total time spent on retries: {end_time - start_time:.2f} seconds.")
+        try:
+            return self.waits.retry(func, attempts=retries, initial_interval=delay)
+        except Exception as e:
+            raise Exception(f"Action {func.__name__} failed after {retries} retries.") from e
 
     @staticmethod
     def contains_money(text):
         """Checks if the provided text contains any amount of money.
 
-        This method uses regular expressions to identify different formats of monetary values
-        within the provided text. Supported formats include:
-        - $111,111.11
-        - $11.1
-        - 11 dollars
-        - 11 USD
+        Supported formats include $111,111.11, $11.1, 11 dollars and 11 USD.
 
         Args:
             text (str): The text to check for monetary values.
@@ -204,16 +376,10 @@ class CustomSelenium:
         Returns:
             bool: True if any monetary value is found, False otherwise.
         """
-        money_patterns = [
-            r'\$\d{1,3}(,\d{3})*(\.\d{2})?',  # $111,111.11 or $11.1
-            r'\b\d{1,3}(,\d{3})*(\.\d{2})?\s+dollars?\b',  # 11 dollars
-            r'\b\d{1,3}(,\d{3})*(\.\d{2})?\s+USD\b'  # 11 USD
-        ]
-        pattern = '|'.join(money_patterns)
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        return contains_money(text)
     
     @staticmethod
-    def relative_time_to_absolute(relative_time):
+    def relative_time_to_absolute(relative_time, now=None):
         """Converts a relative time string to an absolute datetime object.
 
         This method takes a relative time string (e.g., '5 minutes ago', '2 hours ago')
@@ -221,30 +387,12 @@ class CustomSelenium:
 
         Args:
             relative_time (str): The relative time string to convert.
+            now (datetime): The reference time, defaults to the current time.
 
         Returns:
             datetime: The absolute datetime corresponding to the relative time.
         """
-        now = datetime.now()
-        match = re.match(r'·\s*(\d+)\s+(minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)\s+ago', relative_time)
-        if match:
-            value, unit = match.groups()
-            value = int(value)
-            if unit.startswith('minute'):
-                return now - timedelta(minutes=value)
-            elif unit.startswith('hour'):
-                return now - timedelta(hours=value)
-            elif unit.startswith('day'):
-                return now - timedelta(days=value)
-            elif unit.startswith('week'):
-                return now - timedelta(weeks=value)
-            elif unit.startswith('month'):
-                return now - timedelta(days=value * 30)
-            elif unit.startswith('year'):
-                return now - timedelta(days=value * 365)
-        else:
-            print(f"No match for relative_time: {relative_time}")  # Debugging print
-        return now  # If parsing fails, return the current time
+        return relative_time_to_absolute(relative_time, now)
     
     def get_element_text(self, parent, xpath):
         """Gets the text of an element if it exists, otherwise returns None."""
@@ -253,132 +401,210 @@ class CustomSelenium:
         except NoSuchElementException:
             return None
     
-    def extract_article_data(self, element):
-        """Extracts data from a single article element."""
-        title_element = element.find_element(By.XPATH, './/h4[@class="s-title fz-16 lh-20"]/a')
+    def extract_article_data(self, element, time=None):
+        """Extracts data from a single article element.
+
+        Args:
+            element (WebElement): The article element.
+            time (str): The article's time text, if it was already read.
+        """
+        title_element = element.find_element(By.XPATH, TITLE_XPATH)
         title = title_element.get_attribute('title')
         link = title_element.get_attribute('href')
 
-        source = self.get_element_text(element, './/span[@class="s-source mr-5 cite-co"]')
-        time = self.get_element_text(element, './/span[@class="fc-2nd s-time mr-8"]')
-        description = self.get_element_text(element, './/p[@class="s-desc"]')
-        image_url = self.get_image_url(element, title)
-        
-        return News(
-            title=title,
-            link=link,
-            source=source or 'N/A',
-            time=time or 'N/A',
-            description=description or 'N/A',
-            image_url=image_url or 'N/A'
+        return self.build_article({
+            'title': title,
+            'link': link,
+            'source': self.get_element_text(element, SOURCE_XPATH),
+            'time': time if time is not None else self.get_element_text(element, TIME_XPATH),
+            'description': self.get_element_text(element, DESCRIPTION_XPATH),
+            'image_url': self.get_image_url(element, title),
+        })
+
+    def build_article(self, data):
+        """Builds a News object from extracted article fields.
+
+        The remote image URL is kept in image_source; the image is only downloaded
+        once the article is selected, and its file name is filled in by
+        gather_image_downloads.
+        """
+        article = News(
+            title=data['title'],
+            link=data['link'],
+            source=data.get('source') or 'N/A',
+            time=data.get('time') or 'N/A',
+            description=data.get('description') or 'N/A',
+            image_url='N/A'
         )
+        article.image_source = data.get('image_url')
+        return article
  
     def get_image_url(self, element, title):
-        """Attempts to download the article's image and return its URL."""
+        """Returns the URL of the article's image, or None if it has no image.
+
+        Lazy-loaded images keep a placeholder in src and the real URL in data-src.
+        """
         try:
-            image_element = element.find_element(By.XPATH, './/a[@class="thmb "]/img')
-            image_url = image_element.get_attribute('src')
-            
-            if image_url.startswith("http"):
-                image_file_name = f"{title.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d%H%M%S')}.jpg"
-                image_save_path = os.path.join(self.pictures_dir, image_file_name)
-                if self.download_image(image_url, image_save_path):
-                    return os.path.basename(image_save_path)
-                else:
-                    self.logger.warning(f"Failed to download image from URL: {image_url}")
-                    return None
-            else:
-                self.logger.warning(f"Invalid image URL for article: {title} - {image_url}")
-                return None
+            image_element = element.find_element(By.XPATH, IMAGE_XPATH)
+            src = image_element.get_attribute('src')
+            if src and src.startswith('http'):
+                return src
+            return image_element.get_attribute('data-src') or src
         except NoSuchElementException:
             self.logger.warning(f"Image element not found for article: {title}")
             return None
 
-    def print_articles(self):
-        for index, article in enumerate(self.articles, start=1):
-            print(f"Article {index}:\nTitle: {article.title}\nLink: {article.link}\nSource: {article.source}\nTime: {article.time}\nDescription: {article.description}\n")
+    def schedule_image_download(self, article, image_url):
+        """Submits the download of the article's image, to be collected by gather_image_downloads.
+
+        Images are stored by content hash in the pictures directory, so the file name
+        set on the article is the hash-based name, not one derived from the title.
+        """
+        future = self.submit_image_download(article, image_url)
+        if future is not None:
+            self.image_jobs.append((article, image_url, future))
+
+    def submit_image_download(self, article, image_url):
+        """Submits the download of the article's image to the downloader.
+
+        Images already downloaded by a previous attempt of the search (recorded in its
+        checkpoint) are not requested again.
+
+        Returns:
+            Future: Resolves to the stored file name, or None if the article has no valid image URL.
+        """
+        if image_url is None:
+            return None
+        if not image_url.startswith("http"):
+            self.logger.warning(f"Invalid image URL for article: {article.title} - {image_url}")
+            return None
+        file_name = self.completed_downloads.get(image_url)
+        if file_name and os.path.exists(os.path.join(self.pictures_dir, file_name)):
+            future = Future()
+            future.set_result(file_name)
+            return future
+        return self.downloader.submit(image_url)
+
+    def gather_image_downloads(self):
+        """Waits for the scheduled image downloads and stores their file names on the articles."""
+        for article, image_url, future in self.image_jobs:
+            image_file_name = future.result()
+            if image_file_name:
+                article.image_url = image_file_name
+                # Kept for the checkpoint, since image_jobs is cleared below
+                self.completed_downloads[image_url] = image_file_name
+            else:
+                self.logger.warning(f"Failed to download image from URL: {image_url}")
+        self.image_jobs = []
+        self.downloader.store.save()
+
+    def has_stored_image(self, article):
+        """Returns True if the article's image was downloaded into the pictures directory.
+
+        Articles without an image keep 'N/A', and failed downloads keep the image URL.
+        """
+        image_url = article.image_url
+        if not image_url or image_url == 'N/A' or image_url.startswith('http'):
+            return False
+        return os.path.isfile(os.path.join(self.pictures_dir, image_url))
+
+    def log_article_summary(self):
+        """Logs a summary of the collected articles instead of printing every one of them."""
+        articles = self.articles
+        if not articles:
+            self.logger.info("No articles collected.")
+            return
+        enrich_articles(articles, self.reference_time)
+        published = [article.published for article in articles]
+        sources = Counter(article.source for article in articles)
+        with_money = sum(1 for article in articles if article.title_contains_money or article.description_contains_money)
+        with_images = sum(1 for article in articles if self.has_stored_image(article))
+        top_sources = ', '.join(f"{source} ({count})" for source, count in sources.most_common(5))
+        self.logger.info(
+            f"Collected {len(articles)} articles published {min(published):%Y-%m-%d %H:%M} to "
+            f"{max(published):%Y-%m-%d %H:%M}; {with_money} mention money, {with_images} have a "
+            f"downloaded image. Top sources: {top_sources}."
+        )
+        for article in articles:
+            self.logger.debug(f"Collected article: {article}")
 
     def save_results_to_excel(self):
         """Saves the collected articles to an Excel file.
 
-        This method creates a new Excel workbook, adds a worksheet named 'Results',
-        and populates it with the collected article data. The workbook is saved
-        with a filename based on the current date and time.
+        Returns:
+            str: The path of the saved workbook.
+        """
+        return self.save_results(output_format='xlsx')
+
+    def save_results(self, articles=None, output_format=None):
+        """Streams articles to an output file in the configured format.
+
+        The file is named after the current date and time. Rows are written one
+        article at a time by a streaming writer (write-only XLSX, CSV, JSONL or
+        Parquet), so the output is never built in memory as a whole. Every article is
+        also passed to the writers in self.sinks, so in this sequential mode sinks only
+        receive articles once the search is complete; in pipeline mode they receive
+        them as they are written.
 
-        The columns in the worksheet include title, title length, whether the title
-        contains money, link, source, time, description, description length, whether
-        the description contains money, and image filename.
+        The columns include title, title length, whether the title contains money,
+        link, source, time, description, description length, whether the description
+        contains money, and image filename.
+
+        Args:
+            articles (iterable): The articles to save, defaults to self.articles.
+            output_format (str): The output format, defaults to self.output_format.
+
+        Returns:
+            str: The path of the saved file.
 
         Raises:
-            Exception: If there is an error in saving the workbook.
+            Exception: If there is an error in saving the file.
         """
-        print("Starting the creation of the workbook.")
-        
-        # Create a new workbook and add the search results
-        excel = Files()
-        excel.create_workbook(path=None)
-        
-        print("Workbook created successfully.")
-        excel.create_worksheet('Results')
-        
-        # Prepare data to add to Excel
-        data = [
-            ['Title', 'Title Length', 'Title Contains Money', 'Link', 'Source', 'Time', 'Description', 'Description Length', 'Description Contains Money', 'Image']
-        ]
-        
-        for article in self.articles:
-            absolute_time = self.relative_time_to_absolute(article.time)
-            time = absolute_time.strftime('%Y-%m-%d %H:%M:%S')
-            self.logger.debug(f"Adding article to Excel: {article}")
-            title_length = len(article.title)
-            description_length = len(article.description)
-            title_contains_money = self.contains_money(article.title)
-            description_contains_money = self.contains_money(article.description)
-            
-            data.append([
-                article.title,
-                title_length,
-                title_contains_money,
-                article.link,
-                article.source,
-                time,
-                article.description,
-                description_length,
-                description_contains_money,
-                article.image_url,
-            ])
-        
-        self.logger.debug("Data prepared for insertion into Excel.")
-        excel.append_rows_to_worksheet(data, header=True, name='Results')
-        self.logger.debug("Data added to worksheet 'Results'.")
-        
-        # Save the workbook with the current date as the filename
-        file_name = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.xlsx"
-        output_path = os.path.join(get_output_dir(), file_name)
-        excel.save_workbook(output_path)
-        self.logger.info(f"Results saved to: {output_path}")
+        output_format = output_format or self.output_format
+        articles = self.articles if articles is None else articles
+        now = self.reference_time or datetime.now()
+        output_path = self.get_output_path(output_format)
+
+        self.logger.info(f"Writing results to: {output_path}")
+        with create_writer(output_format, output_path) as writer:
+            for article in articles:
+                if article.published is None:
+                    article.enrich(now)
+                self.logger.debug(f"Adding article to output: {article}")
+                writer.write(article)
+                for sink in self.sinks:
+                    sink.write(article)
+        self.logger.info(f"{writer.count} results saved to: {output_path}")
+        return output_path
+
+    def get_output_path(self, extension):
+        """Returns an unused output file path named after the current date and time."""
+        return unique_output_path(self.output_dir, extension)
 
-    def wait_for_new_tab_to_load(self):
+    def wait_for_new_tab_to_load(self, timeout=30):
         """Waits for a new tab to load by checking the number of window handles.
 
-        This method attempts to detect a new tab by checking the number of
-        window handles every 5 seconds, up to a maximum of 6 attempts (30 seconds).
+        The window handles are polled with the shared wait scheduler, quickly at
+        first and then with backoff, for up to the given timeout.
+
+        Args:
+            timeout (int): The maximum time to wait, in seconds (default is 30).
 
         Raises:
             AssertionError: If the new tab does not load within the expected time.
         """
-        max_attempts = 6  # Check for up to 30 seconds (6 * 5s)
-        for _ in range(max_attempts):
-            time.sleep(5)
-            if len(self.browser.get_window_handles()) > 1:
-                return
-        raise AssertionError("The new tab did not load within the expected time.")
+        self.waits.wait_until(
+            lambda: len(self.browser.get_window_handles()) > 1,
+            timeout=timeout,
+            description='new tab to load',
+            error="The new tab did not load within the expected time.",
+        )
 
     def wait_for_element_to_be_visible(self, xpath, timeout=60):
         """Waits for an element to become visible on the page.
 
-        This method attempts to wait until the specified element is visible
-        by checking every 5 seconds, up to the specified timeout period.
+        The element is polled with the shared wait scheduler, quickly at first and
+        then with backoff, for up to the timeout or the run's remaining budget.
 
         Args:
             xpath (str): The XPath of the element to wait for.
@@ -387,21 +613,38 @@ class CustomSelenium:
         Raises:
             AssertionError: If the element does not become visible within the timeout period.
         """
-        max_attempts = timeout // 5  # Check every 5 seconds up to the timeout
-        for _ in range(max_attempts):
-            try:
-                self.browser.wait_until_element_is_visible(xpath, timeout='5s')
-                return
-            except Exception:
-                time.sleep(5)
-        raise AssertionError(f"Element {xpath} not visible after {timeout} seconds.")
+        self.waits.wait_until(
+            lambda: self.browser.is_element_visible(xpath),
+            timeout=timeout,
+            description=f'{xpath} visible',
+            error=f"Element {xpath} not visible after {timeout} seconds.",
+        )
 
     def close_browser(self):
-        """Closes the browser and cleans up resources."""
+        """Closes the browser and cleans up resources.
+
+        A browser leased from the browser service only has its WebDriver session
+        ended and is returned to the service, which keeps it running.
+        """
         try:
             self.browser.close_browser()
         except Exception as e:
             self.logger.error(f"Error closing browser: {e}")
+        self.browser_open = False
+        if self.browser_lease is not None:
+            try:
+                self.browser_service.release(self.browser_lease)
+            except Exception as e:
+                self.logger.error(f"Error releasing the browser to the browser service: {e}")
+            self.browser_lease = None
+        self.close_resources()
+
+    def close_resources(self):
+        """Waits for pending downloads and closes the HTTP session and the article index."""
+        self.downloader.close()
+        if self.index is not None:
+            self.index.close()
+            self.index = None
 
     def switch_to_new_tab(self):
         """Switches to the newly opened browser tab.
@@ -412,66 +655,419 @@ class CustomSelenium:
         self.browser.switch_window(locator='NEW')
         self.logger.info("Switched to the new tab.")
     
-    def open_browser(self, url: str, word: str, months: int):
+    def open_browser(self, url: str, word: str, months: int, max_articles: int = None):
         """Opens a browser, searches for a keyword, and processes the results.
 
-        This method opens a browser, inputs a search term, waits for the results page
-        to load, switches to a new tab, finds and clicks the 'News' link, waits for the 
-        news page to load, collects articles, prints them, and saves the results to an 
-        Excel file.
+        This method opens a browser, navigates to the news search results (directly or
+        through the homepage search, 'News' tab and link), waits for the news page to
+        load, collects articles, logs a summary of them, and saves the results in the configured
+        output format.
 
         Args:
             url (str): The URL to open.
             word (str): The search keyword to input.
             months (int): The number of months to filter the articles by.
+            max_articles (int): The maximum number of articles to collect, or None for no limit.
         """
     
         try:
-            self.logger.info("Attempting to open the browser.")
+            self.search(url, word, months, max_articles)
+        except AssertionError as e:
+            self.logger.error(f"Error waiting for the element: {e}")
+        finally:
+            self.close_browser()
 
-            # headless
-            options = create_headless_options()
+    def search(self, url: str, word: str, months: int, max_articles: int = None):
+        """Searches for a keyword and saves the results, keeping the browser open.
 
-            self.retry_action(lambda: self.browser.open_available_browser(url))
-            self.browser.maximize_browser_window()
-            self.logger.info(f"Opening URL: {url}")
+        The browser is launched on the first call and reused by the following ones,
+        so several searches can share one browser session. Call close_browser when
+        done.
 
-            # Wait for the search button to be visible and click it
-            self.logger.info("Waiting for the search box to be visible.")
-            self.browser.wait_until_element_is_visible('id=ybar-sbq', timeout=180)
-            
-            # Locate the search box and input the search term
-            search_box = self.browser.find_element('id=ybar-sbq')
-            self.browser.input_text(search_box, word)
-            self.browser.submit_form(search_box)
-            self.logger.info(f"Input search keyword: {word}")
+        When an index mode is set, articles already in the persistent index for this
+        search phrase are skipped, and the output holds either the new articles only
+        ('new') or the merged view of new and indexed articles ('full').
 
-            # Wait until the results page is loaded in the new tab
-            self.wait_for_new_tab_to_load()
-            self.switch_to_new_tab()
-            
-            # Now look for the "News" link and click it
-            self.find_and_click_news_link()
+        In pipeline mode the articles are streamed through an ArticlePipeline instead.
+        The 'full' index mode needs the whole run before writing, so it always runs
+        sequentially.
 
-            # Wait until the news page is fully loaded
-            self.wait_for_element_to_be_visible('xpath://ol[@class="mb-15 reg searchCenterMiddle"]', timeout=60)
+        Args:
+            url (str): The URL to open.
+            word (str): The search keyword to input.
+            months (int): The number of months to filter the articles by.
+            max_articles (int): The maximum number of articles to collect, or None for no limit.
 
-            # Collect the articles
-            self.collect_articles()
+        Returns:
+            str: The path of the saved results file.
 
-            self.filter_articles_by_date(months)
+        Raises:
+            AssertionError: If the results page does not load within the expected time.
+        """
+        output_path = None
+        try:
+            if self.pipeline and self.index_mode != 'full':
+                output_path = self.search_pipelined(url, word, months, max_articles)
+                return output_path
 
-            # Print the collected articles
-            self.print_articles()
+            self.scrape(url, word, months, max_articles)
 
-            # Save the results to an Excel file
-            self.save_results_to_excel()
-        except AssertionError as e:
-            self.logger.error(f"Error waiting for the element: {e}")
+            # Save the results in the configured output format
+            with self.tracer.span('save'):
+                output_path = self.save_results()
+            self.clear_checkpoint()
+            return output_path
         finally:
-            self.close_browser()
+            self.save_trace(output_path)
+
+    def scrape(self, url: str, word: str, months: int, max_articles: int = None):
+        """Collects, filters and enriches the articles for a keyword without saving them.
+
+        Unless checkpoints are disabled, the progress is saved to a checkpoint file in
+        the output directory after every results page and stage. If a checkpoint of
+        the same search is found, for example one left by a failed attempt, the
+        search resumes from the last completed stage: collection continues from the
+        recorded results page, and images already downloaded are not fetched again.
+        The checkpoint is deleted by clear_checkpoint once the results are saved.
+
+        Args:
+            url (str): The URL to open.
+            word (str): The search keyword to input.
+            months (int): The number of months to filter the articles by.
+            max_articles (int): The maximum number of articles to collect, or None for no limit.
+
+        Returns:
+            list: The collected articles, also kept in self.articles.
+        """
+        self.start_run(word)
+        checkpoint = self.resume_checkpoint(word, months, max_articles)
+
+        if not checkpoint.reached('collected'):
+            remaining = max_articles - len(self.articles) if max_articles is not None else None
+            if remaining is None or remaining > 0:
+                with self.tracer.span('navigate'):
+                    if checkpoint.results_url:
+                        self.open_results_url(checkpoint.results_url)
+                    else:
+                        self.navigate_to_results(url, word)
+
+                # Collect the articles
+                with self.tracer.span('collect'):
+                    self.collect_articles(months=months, max_articles=remaining)
+            self.save_checkpoint('collected')
+
+        with self.tracer.span('filter'):
+            self.filter_articles_by_date(months)
+
+        # Wait for the image downloads started during collection
+        if not checkpoint.reached('images'):
+            with self.tracer.span('image_downloads'):
+                self.gather_image_downloads()
+            self.save_checkpoint('images')
+
+        if self.index_mode and not checkpoint.reached('indexed'):
+            with self.tracer.span('index'):
+                self.update_index(word, months)
+            self.save_checkpoint('indexed')
+
+        self.log_article_summary()
+
+        self.waits.log_summary()
+        return self.articles
+
+    def search_pipelined(self, url: str, word: str, months: int, max_articles: int = None):
+        """Searches for a keyword, streaming articles to the output file while paging.
+
+        Paging the results, downloading the images and writing the rows overlap
+        instead of running one after the other; see ArticlePipeline.
+
+        Pipelined searches are not checkpointed: if the pipeline fails, its partly
+        written results file is deleted and a retry starts the search over.
+
+        Returns:
+            str: The path of the saved results file.
+        """
+        self.start_run(word)
+
+        with self.tracer.span('navigate'):
+            self.navigate_to_results(url, word)
+
+        output_path = self.get_output_path(self.output_format)
+        self.logger.info(f"Streaming results to: {output_path}")
+        with self.tracer.span('pipeline'):
+            pipeline = ArticlePipeline(self, queue_size=self.queue_size, consumers=self.downloader.max_workers)
+            try:
+                asyncio.run(pipeline.run(output_path, months=months, max_articles=max_articles))
+            except BaseException:
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                raise
+        self.downloader.store.save()
+
+        if self.index_mode:
+            with self.tracer.span('index'):
+                self.update_index(word, months)
+
+        self.log_article_summary()
+
+        self.waits.log_summary()
+        return output_path
+
+    def start_run(self, word):
+        """Resets the per-search state before a new search for a keyword."""
+        self.articles = []
+        self.image_jobs = []
+        self.checkpoint = None
+        self.completed_downloads = {}
+        self.downloader.forget_finished()
+        self.reference_time = datetime.now()
+        self.known_links = self.open_index().links(word) if self.index_mode else set()
+        self.tracer = Tracer()
+        self.waits.start()
+
+    def resume_checkpoint(self, word, months, max_articles):
+        """Opens the checkpoint of a search and restores the progress it records.
+
+        Returns:
+            Checkpoint: The checkpoint, with no stage reached if there was nothing to resume.
+        """
+        key = {
+            'search_phrase': word,
+            'months': months,
+            'max_articles': max_articles,
+            'index_mode': self.index_mode,
+            'backend': type(self).__name__,
+        }
+        checkpoint = Checkpoint.for_search(self.output_dir, key)
+        if not self.checkpoints:
+            return checkpoint
+        self.checkpoint = checkpoint
+        if not checkpoint.load():
+            return checkpoint
+
+        self.reference_time = checkpoint.reference_time
+        self.articles = [News.from_dict(data) for data in checkpoint.articles]
+        self.completed_downloads = dict(checkpoint.downloads)
+        self.known_links.update(article.link for article in self.articles)
+        self.logger.info(
+            f"Resuming '{word}' after the '{checkpoint.stage}' stage with {len(self.articles)} articles "
+            f"and {len(self.completed_downloads)} downloaded images."
+        )
+        if not checkpoint.reached('images'):
+            # Reschedule the images of the restored articles; completed ones are not fetched again
+            for article in self.articles:
+                self.schedule_image_download(article, article.image_source)
+        return checkpoint
+
+    def save_checkpoint(self, stage, results_url=None):
+        """Saves the progress of the current search, if checkpoints are enabled."""
+        if self.checkpoint is None:
+            return
+        for _, image_url, future in self.image_jobs:
+            if future.done() and future.result():
+                self.completed_downloads[image_url] = future.result()
+        try:
+            self.checkpoint.save(stage, self.reference_time, self.articles, results_url, self.completed_downloads)
+        except OSError as e:
+            self.logger.error(f"Error saving checkpoint to {self.checkpoint.path}: {e}")
+
+    def clear_checkpoint(self):
+        """Deletes the checkpoint of the current search once its results are saved."""
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+            self.checkpoint = None
 
+    def current_results_url(self):
+        """Returns the URL of the results page currently open."""
+        return self.browser.get_location()
 
+    def save_trace(self, output_path=None):
+        """Writes the run's stage timings and counters as a JSON/Chrome trace file.
 
+        The trace is saved next to the results file, or under its own timestamped
+        name in the output directory if the run produced no results file.
+        """
+        if output_path:
+            trace_path = f"{os.path.splitext(output_path)[0]}.trace.json"
+        else:
+            trace_path = self.get_output_path('trace.json')
+        try:
+            self.tracer.save(trace_path)
+        except OSError as e:
+            self.logger.error(f"Error saving trace to {trace_path}: {e}")
+            return None
+        for span in self.tracer.spans:
+            self.logger.info(f"Stage '{span.name}' took {span.duration or 0:.2f} seconds {span.counters}.")
+        self.logger.info(f"Trace saved to: {trace_path}")
+        return trace_path
+
+    def open_index(self):
+        """Opens the persistent article index on first use."""
+        if self.index is None:
+            self.index = ArticleIndex(self.index_path)
+        return self.index
+
+    def update_index(self, word, months):
+        """Records the collected articles in the index and applies the index output mode.
+
+        In 'new' mode self.articles keeps only the articles first seen in this run;
+        in 'full' mode it is replaced by every indexed article for the search phrase
+        within the months cutoff, new and previously seen.
+        """
+        index = self.open_index()
+        index.record(self.articles, word, self.reference_time)
+        self.logger.info(f"{len(self.articles)} new articles recorded in the index.")
+        if self.index_mode == 'full':
+            cutoff_date = self.reference_time - relativedelta(months=months)
+            self.articles = index.load(word, since=cutoff_date, now=self.reference_time)
+
+    def launch_browser(self, url):
+        """Opens the browser with the configured browser profile and loads the given URL.
+
+        The browser starts on a blank page so the profile's URL blocking is in place
+        before the first real page load. With a browser service, a warm browser is
+        leased from it instead of launching one.
+        """
+        profile = self.browser_profile
+
+        with self.tracer.span('launch'):
+            if self.browser_service is not None:
+                self.attach_to_service()
+            else:
+                self.logger.info(f"Attempting to open the browser with the '{profile.name}' profile.")
+                self.retry_action(lambda: self.browser.open_available_browser(
+                    'about:blank',
+                    browser_selection='chrome',
+                    headless=profile.headless,
+                    options=profile.options(),
+                ))
+            self.browser_open = True
+            count_webdriver_commands(self.browser.driver, lambda command: self.tracer.count('webdriver_commands'))
+            profile.apply(self.browser.driver)
+            if not profile.headless:
+                self.browser.maximize_browser_window()
+
+        self.logger.info(f"Opening URL: {url}")
+        self.browser.go_to(url)
+
+    def attach_to_service(self):
+        """Leases a warm browser from the browser service and opens a clean tab in it.
+
+        The tabs left over by previous runs are closed; cookies and cache are kept.
+        """
+        self.browser_lease = self.browser_service.acquire()
+        self.logger.info(f"Attaching to the service browser at {self.browser_lease.debugger_address}.")
+        options = self.browser_profile.attach_options(self.browser_lease.debugger_address)
+        try:
+            if self.browser_lease.remote_url:
+                self.browser.open_browser(browser='chrome', remote_url=self.browser_lease.remote_url, options=options)
+            else:
+                self.browser.open_available_browser(browser_selection='chrome', options=options)
+            driver = self.browser.driver
+            stale_handles = driver.window_handles
+            driver.switch_to.new_window('tab')
+            for handle in stale_handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+        except Exception:
+            self.browser_service.release(self.browser_lease)
+            self.browser_lease = None
+            raise
+
+    def reset_tabs(self):
+        """Closes every tab but the first one and switches back to it."""
+        handles = self.browser.get_window_handles()
+        for handle in handles[1:]:
+            self.browser.switch_window(handle)
+            self.browser.close_window()
+        self.browser.switch_window(handles[0])
+
+    def navigate_to_results(self, url, word):
+        """Navigates to the news search results for a keyword.
+
+        In 'direct' navigation mode the news search URL is opened straight away; the
+        homepage search is only used if the results list does not show up. In 'click'
+        mode the homepage search is always used.
+
+        Args:
+            url (str): The homepage URL, used by the homepage search.
+            word (str): The search keyword.
+
+        Raises:
+            AssertionError: If the results page does not load within the expected time.
+        """
+        if self.navigation == 'direct':
+            try:
+                self.open_search_results(word)
+                return
+            except AssertionError as e:
+                self.logger.warning(f"Direct navigation failed, falling back to the homepage search: {e}")
+        self.search_from_homepage(url, word)
+
+    def open_search_results(self, word, timeout=15):
+        """Opens the news search results URL for a keyword in the current tab.
+
+        Raises:
+            AssertionError: If the results list is not visible within the timeout.
+        """
+        with self.tracer.span('direct_navigation'):
+            self.open_results_url(build_news_search_url(word, self.search_url), timeout=timeout)
+
+    def open_results_url(self, results_url, timeout=15):
+        """Opens a search results page URL in the current tab, launching the browser if needed.
+
+        Raises:
+            AssertionError: If the results list is not visible within the timeout.
+        """
+        if self.browser_open:
+            self.reset_tabs()
+            self.browser.go_to(results_url)
+            self.logger.info(f"Opening URL: {results_url}")
+        else:
+            self.launch_browser(results_url)
+        self.wait_for_element_to_be_visible(f'xpath:{RESULTS_XPATH}', timeout=timeout)
+
+    def search_from_homepage(self, url, word):
+        """Opens the homepage, searches for a keyword and clicks through to the news results.
+
+        The browser is launched if it is not open yet; otherwise the current session
+        is reused.
+
+        Args:
+            url (str): The URL to open.
+            word (str): The search keyword to input.
+
+        Raises:
+            AssertionError: If the results page does not load within the expected time.
+        """
+        with self.tracer.span('homepage'):
+            if self.browser_open:
+                self.reset_tabs()
+                self.browser.go_to(url)
+                self.logger.info(f"Opening URL: {url}")
+            else:
+                self.launch_browser(url)
+
+            # Wait for the search button to be visible and click it
+            self.logger.info("Waiting for the search box to be visible.")
+            self.wait_for_element_to_be_visible('id=ybar-sbq', timeout=180)
         
+        # Locate the search box and input the search term
+        with self.tracer.span('search_submit'):
+            search_box = self.browser.find_element('id=ybar-sbq')
+            self.browser.input_text(search_box, word)
+            self.browser.submit_form(search_box)
+            self.logger.info(f"Input search keyword: {word}")
+
+        # Wait until the results page is loaded in the new tab
+        with self.tracer.span('tab_wait'):
+            self.wait_for_new_tab_to_load()
+            self.switch_to_new_tab()
         
+        # Now look for the "News" link and click it
+        with self.tracer.span('news_click'):
+            self.find_and_click_news_link()
+
+            # Wait until the news page is fully loaded
+            self.wait_for_element_to_be_visible(f'xpath:{RESULTS_XPATH}', timeout=60)
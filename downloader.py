@@ -0,0 +1,306 @@
+import os
+import json
+import time
+import logging
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+IMAGE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/avif': '.avif',
+}
+
+
+class ImageTooLargeError(Exception):
+    """Raised when an image exceeds the store's maximum file size."""
+
+
+class ImageStore:
+    """Content-addressed store for downloaded images.
+
+    Images are saved under the SHA-256 of their content, so the same thumbnail is
+    kept once however many articles or runs reference it. A JSON manifest maps each
+    image URL to its file and to the ETag/Last-Modified validators used to revalidate
+    it. Unfinished downloads are kept as partial files so they can be resumed.
+    """
+
+    def __init__(self, directory, max_size=10 * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.directory = directory
+        self.max_size = max_size
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self.partial_dir = os.path.join(directory, '.partial')
+        os.makedirs(self.partial_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.manifest = self._read_manifest()
+        self._remove_stale_partials()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            self.logger.warning(f"Ignoring unreadable image manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _remove_stale_partials(self, max_age=24 * 3600):
+        """Deletes the partial downloads left behind by processes that ended long ago."""
+        now = time.time()
+        for name in os.listdir(self.partial_dir):
+            path = os.path.join(self.partial_dir, name)
+            try:
+                if now - os.path.getmtime(path) > max_age:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def lookup(self, url):
+        """Returns the manifest entry of a URL whose file is still on disk, or None."""
+        with self._lock:
+            entry = self.manifest.get(url)
+        if entry and os.path.exists(os.path.join(self.directory, entry['file'])):
+            return entry
+        return None
+
+    @staticmethod
+    def validators(entry):
+        """Returns the conditional request headers for a manifest entry."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def partial_path(self, url):
+        """Returns the path of the partial download of a URL by the current process.
+
+        The path includes the process id, so parallel worker processes sharing the
+        pictures directory never write to the same partial file. A download is
+        resumed by later attempts of the same process.
+        """
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.partial_dir, f"{digest}-{os.getpid()}.part")
+
+    def partial_validators_path(self, url):
+        """Returns the path of the validators of the partial download of a URL."""
+        return self.partial_path(url)[:-len('.part')] + '.json'
+
+    def save_partial_validators(self, url, headers):
+        """Records the ETag/Last-Modified of the response a partial download started from.
+
+        They are sent as If-Range when resuming, so the rest of the file is only
+        appended if the image is still the same.
+        """
+        validators = {'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+        with open(self.partial_validators_path(url), 'w', encoding='utf-8') as file:
+            json.dump(validators, file)
+
+    def partial_validators(self, url):
+        """Returns the If-Range value for resuming the partial download of a URL, or None.
+
+        Weak ETags cannot be used with If-Range, in which case Last-Modified is used.
+        """
+        try:
+            with open(self.partial_validators_path(url), encoding='utf-8') as file:
+                validators = json.load(file)
+        except (OSError, ValueError):
+            return None
+        etag = validators.get('etag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return validators.get('last_modified')
+
+    def discard_partial(self, url):
+        """Deletes the partial download of a URL and its validators."""
+        for path in (self.partial_path(url), self.partial_validators_path(url)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def commit(self, url, partial_path, headers):
+        """Moves a completed download into the store and records it in the manifest.
+
+        Args:
+            url (str): The image URL.
+            partial_path (str): The path of the completed download.
+            headers (Mapping): The response headers, used for the extension and validators.
+
+        Returns:
+            str: The file name of the image in the store.
+        """
+        digest = hashlib.sha256()
+        with open(partial_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        content_type = headers.get('Content-Type', '').split(';')[0].strip().lower()
+        file_name = digest.hexdigest() + IMAGE_EXTENSIONS.get(content_type, '.jpg')
+        file_path = os.path.join(self.directory, file_name)
+        if os.path.exists(file_path):
+            os.remove(partial_path)
+        else:
+            os.replace(partial_path, file_path)
+        validators_path = self.partial_validators_path(url)
+        if os.path.exists(validators_path):
+            os.remove(validators_path)
+        with self._lock:
+            self.manifest[url] = {
+                'file': file_name,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+            }
+        return file_name
+
+    def save(self):
+        """Writes the manifest, merged with entries saved meanwhile by other processes."""
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest.update(self.manifest)
+            self.manifest = manifest
+            temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file)
+            os.replace(temp_path, self.manifest_path)
+
+
+class ImageDownloader:
+    """Downloads images concurrently over a shared, connection-pooled HTTP session.
+
+    Jobs are submitted to a bounded thread pool and return futures, so callers can
+    keep scraping while the images are fetched in the background. The number of
+    simultaneous requests against a single host is capped to stay polite.
+
+    Images go into an ImageStore: known URLs are revalidated with conditional
+    requests, interrupted downloads are resumed with Range/If-Range requests, and
+    a URL is not fetched again while its earlier job is kept, unless that job failed.
+    """
+
+    def __init__(self, store, max_workers=8, max_per_host=4, timeout=15, chunk_size=256 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-download')
+        self.on_bytes = None  # Optional callback receiving the size of every downloaded chunk
+        self._host_limits = {}
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _host_limit(self, url):
+        """Returns the semaphore limiting concurrent requests to the URL's host."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def download(self, url):
+        """
+        Downloads an image from the specified URL into the image store.
+
+        :param url: URL of the image to be downloaded.
+        :return: The file name of the image in the store, or None if the download failed.
+        """
+        partial_path = self.store.partial_path(url)
+        try:
+            with self._host_limit(url):
+                return self._fetch(url, partial_path)
+        except ImageTooLargeError as e:
+            self.logger.warning(f"Skipping image from {url}: {e}")
+            self.store.discard_partial(url)
+            return None
+        except Exception as e:
+            self.logger.error(f"Error downloading image from {url}: {e}")
+            return None
+
+    def _fetch(self, url, partial_path):
+        entry = self.store.lookup(url)
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        if_range = self.store.partial_validators(url) if offset else None
+        if offset and not if_range:
+            # Without a validator the partial file may belong to an older version of the image
+            self.store.discard_partial(url)
+            offset = 0
+        if entry:
+            headers = self.store.validators(entry)
+        elif offset:
+            headers = {'Range': f'bytes={offset}-', 'If-Range': if_range}
+        else:
+            headers = {}
+
+        with self.session.get(url, stream=True, timeout=self.timeout, headers=headers) as response:
+            if response.status_code == 304 and entry:
+                return entry['file']
+            if response.status_code == 206 and offset and response.headers.get('Content-Range', '').startswith(f'bytes {offset}-'):
+                mode = 'ab'
+            elif response.status_code == 200:
+                # A fresh download, or the image changed since the partial file was started
+                mode = 'wb'
+                offset = 0
+                self.store.save_partial_validators(url, response.headers)
+            elif response.status_code in (206, 416) and offset:
+                # The partial file cannot be resumed, or the server sent a range other than
+                # the one requested; start over on the next attempt
+                self.store.discard_partial(url)
+                return None
+            else:
+                return None
+
+            content_length = response.headers.get('Content-Length')
+            if content_length and offset + int(content_length) > self.store.max_size:
+                raise ImageTooLargeError(f"{offset + int(content_length)} bytes exceeds {self.store.max_size} bytes")
+
+            size = offset
+            with open(partial_path, mode) as file:
+                for chunk in response.iter_content(self.chunk_size):
+                    size += len(chunk)
+                    if size > self.store.max_size:
+                        raise ImageTooLargeError(f"more than {self.store.max_size} bytes")
+                    file.write(chunk)
+                    if self.on_bytes:
+                        self.on_bytes(len(chunk))
+            return self.store.commit(url, partial_path, response.headers)
+
+    def submit(self, url):
+        """Schedules an image download and returns a future resolving to the stored file name.
+
+        Submitting a URL that was already submitted returns the existing future,
+        unless that download failed, in which case it is tried again.
+        """
+        with self._lock:
+            job = self._jobs.get(url)
+            if job is None or (job.done() and job.result() is None):
+                job = self._jobs[url] = self.executor.submit(self.download, url)
+            return job
+
+    def forget_finished(self):
+        """Drops the finished jobs, so later submissions of their URLs go through the store again."""
+        with self._lock:
+            self._jobs = {url: job for url, job in self._jobs.items() if not job.done()}
+
+    def close(self):
+        """Waits for pending downloads, saves the manifest and releases the pool and the HTTP session."""
+        self.executor.shutdown(wait=True)
+        self.store.save()
+        self.session.close()
@@ -0,0 +1,158 @@
+"""Local HTTP server serving synthetic Yahoo News search results and thumbnails.
+
+The generated markup follows the searchCenterMiddle / NewsArticle / s-title
+structure the scrapers read, so the whole pipeline can run offline.
+"""
+import hashlib
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+ARTICLE_TEMPLATE = """
+<li>
+  <div class="dd NewsArticle">
+    <ul><li><a class="thmb " href="{link}"><img src="{image_url}" width="143" height="86"></a></li></ul>
+    <div>
+      <h4 class="s-title fz-16 lh-20"><a href="{link}" title="{title}">{title}</a></h4>
+      <span class="s-source mr-5 cite-co">{source}</span>
+      <span class="fc-2nd s-time mr-8">· {age}</span>
+      <p class="s-desc">{description}</p>
+    </div>
+  </div>
+</li>
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>{phrase} - Yahoo News Search Results</title></head>
+<body>
+  <ol class="mb-15 reg searchCenterMiddle">{articles}</ol>
+  <div class="compPagination">{next_link}</div>
+</body>
+</html>
+"""
+
+
+def relative_age(hours):
+    """Formats an age in hours the way the results page does, e.g. '3 days ago'."""
+    for unit, size in (('month', 24 * 30), ('week', 24 * 7), ('day', 24), ('hour', 1)):
+        if hours >= size:
+            value = hours // size
+            return f"{value} {unit}{'s' if value > 1 else ''} ago"
+    return "30 minutes ago"
+
+
+def synthetic_jpeg(index, size):
+    """Returns JPEG-framed bytes of about the given size, unique per index."""
+    seed = hashlib.sha256(str(index).encode()).digest()
+    payload = (seed * (size // len(seed) + 1))[:max(size - 8, 0)]
+    chunks = [payload[i:i + 65000] for i in range(0, len(payload), 65000)] or [b'']
+    comments = b''.join(b'\xff\xfe' + (len(chunk) + 2).to_bytes(2, 'big') + chunk for chunk in chunks)
+    return b'\xff\xd8' + comments + b'\xff\xd9'
+
+
+class FixtureServer:
+    """Serves generated search results pages and images from a background thread.
+
+    Args:
+        articles (int): The total number of articles across all result pages.
+        per_page (int): The number of articles per results page.
+        page_latency (float): Seconds to wait before answering a results page request.
+        image_latency (float): Seconds to wait before answering an image request.
+        image_size (int): The size of each image in bytes.
+        hours_step (int): How many hours older each article is than the previous one.
+    """
+
+    def __init__(self, articles=100, per_page=10, page_latency=0.0, image_latency=0.0, image_size=8192,
+                 hours_step=1, host='127.0.0.1', port=0):
+        self.articles = articles
+        self.per_page = per_page
+        self.page_latency = page_latency
+        self.image_latency = image_latency
+        self.image_size = image_size
+        self.hours_step = hours_step
+        self.server = ThreadingHTTPServer((host, port), FixtureRequestHandler)
+        self.server.fixture = self
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def search_url(self):
+        return f"{self.url}/search"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='fixture-server', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def render_results_page(self, phrase, start):
+        """Renders the results page listing articles start to start + per_page - 1 (1-based)."""
+        end = min(start + self.per_page, self.articles + 1)
+        articles = []
+        for index in range(start, end):
+            articles.append(ARTICLE_TEMPLATE.format(
+                link=f"{self.url}/news/{index}",
+                image_url=f"{self.url}/img/{index}.jpg",
+                title=html.escape(f"{phrase} story {index} sees $1,{index % 1000:03d} in sales"),
+                source="Fixture News",
+                age=relative_age(index * self.hours_step),
+                description=html.escape(f"Synthetic description number {index} about {phrase}."),
+            ))
+        next_link = ''
+        if end <= self.articles:
+            query = urlencode({'p': phrase, 'b': end})
+            next_link = f'<a class="next" href="{self.url}/search?{query}">Next</a>'
+        return PAGE_TEMPLATE.format(phrase=html.escape(phrase), articles=''.join(articles), next_link=next_link)
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        fixture = self.server.fixture
+        url = urlparse(self.path)
+        if url.path == '/search':
+            query = parse_qs(url.query)
+            phrase = query.get('p', [''])[0]
+            start = int(query.get('b', ['1'])[0])
+            time.sleep(fixture.page_latency)
+            self.respond(200, 'text/html; charset=utf-8', fixture.render_results_page(phrase, start).encode('utf-8'))
+        elif url.path.startswith('/img/') and url.path.endswith('.jpg'):
+            index = url.path[len('/img/'):-len('.jpg')]
+            etag = f'"{index}-{fixture.image_size}"'
+            time.sleep(fixture.image_latency)
+            if self.headers.get('If-None-Match') == etag:
+                self.respond(304, 'image/jpeg', b'', {'ETag': etag})
+            else:
+                self.respond(200, 'image/jpeg', synthetic_jpeg(index, fixture.image_size), {'ETag': etag})
+        else:
+            self.respond(404, 'text/plain', b'Not found')
+
+    def respond(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output free of per-request logs
+        pass
@@ -0,0 +1,73 @@
+from custom import CustomSelenium, build_news_search_url
+from results_parser import parse_results_page
+
+HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+    ),
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+class HttpNewsScraper(CustomSelenium):
+    """Scrapes the news search results over plain HTTP instead of driving Chrome.
+
+    The results markup is static, so the search URL is fetched directly and parsed
+    with lxml. Collection, filtering, image downloads and the Excel output are
+    shared with CustomSelenium.
+    """
+
+    def __init__(self, timeout=15, **kwargs):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+        self.session = self.downloader.session
+        self.page_url = None
+        self.page_articles = []
+        self.next_url = None
+
+    def load_page(self, url):
+        """Fetches and parses a search results page.
+
+        Raises:
+            requests.HTTPError: If the page cannot be fetched.
+        """
+        self.logger.info(f"Fetching results page: {url}")
+        response = self.session.get(url, headers=HEADERS, timeout=self.timeout)
+        response.raise_for_status()
+        self.tracer.count('http_requests')
+        self.tracer.count('page_bytes', len(response.content))
+        self.page_url = response.url
+        self.page_articles, self.next_url = parse_results_page(response.text, base_url=response.url)
+
+    def navigate_to_results(self, url, word):
+        """Fetches the first news search results page for a keyword.
+
+        Args:
+            url (str): Unused; the search URL is built from the keyword.
+            word (str): The search keyword.
+        """
+        self.load_page(build_news_search_url(word, self.search_url))
+
+    def open_results_url(self, results_url, timeout=None):
+        """Fetches a search results page URL, such as the one recorded in a checkpoint."""
+        self.load_page(results_url)
+
+    def current_results_url(self):
+        """Returns the URL of the results page currently loaded."""
+        return self.page_url
+
+    def extract_page_articles(self, now, cutoff_date=None, limit=None):
+        """Builds the articles parsed from the current results page that pass the cutoff."""
+        return self.select_articles(self.build_articles(self.page_articles), now, cutoff_date, limit)
+
+    def go_to_next_page(self):
+        """Fetches the next results page, returning False on the last page."""
+        if not self.next_url or self.next_url == self.page_url:
+            return False
+        self.load_page(self.next_url)
+        return True
+
+    def close_browser(self):
+        """Waits for pending downloads and closes the HTTP session and the index."""
+        self.close_resources()
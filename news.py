@@ -0,0 +1,143 @@
+import re
+import logging
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Every supported amount starts with "$" or a digit; the lookahead lets the engine skip
+# other positions before trying the alternatives.
+MONEY_PATTERN = re.compile(
+    r'(?=[$\d])(?:'
+    r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?'  # $111,111.11 or $11.1
+    r'|\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s+(?:dollars?|USD)\b'  # 11 dollars or 11 USD
+    r')',
+    re.IGNORECASE,
+)
+
+RELATIVE_TIME_PATTERN = re.compile(r'·\s*(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago')
+
+TIME_UNITS = {
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+
+def contains_money(text):
+    """Checks if the provided text contains any amount of money.
+
+    Supported formats include $111,111.11, $11.1, 11 dollars and 11 USD.
+
+    Args:
+        text (str): The text to check for monetary values.
+
+    Returns:
+        bool: True if any monetary value is found, False otherwise.
+    """
+    return MONEY_PATTERN.search(text) is not None
+
+
+def relative_time_to_absolute(relative_time, now=None):
+    """Converts a relative time string (e.g. '· 5 minutes ago') to an absolute datetime.
+
+    Args:
+        relative_time (str): The relative time string to convert.
+        now (datetime): The reference time, defaults to the current time.
+
+    Returns:
+        datetime: The absolute datetime, or the reference time if parsing fails.
+    """
+    if now is None:
+        now = datetime.now()
+    match = RELATIVE_TIME_PATTERN.match(relative_time)
+    if match is None:
+        logger.debug(f"No match for relative_time: {relative_time}")
+        return now
+    value, unit = match.groups()
+    return now - int(value) * TIME_UNITS[unit]
+
+
+class News:
+    """A news article, with fields derived once by enrich and cached for filtering and output."""
+
+    __slots__ = (
+        'title',
+        'link',
+        'source',
+        'time',
+        'description',
+        'image_url',
+        'image_source',
+        'published',
+        'title_length',
+        'description_length',
+        'title_contains_money',
+        'description_contains_money',
+    )
+
+    def __init__(self, title, link, source, time, description, image_url):
+        self.title = title
+        self.link = link
+        self.source = source
+        self.time = time
+        self.description = description
+        self.image_url = image_url
+        self.image_source = None
+        self.published = None
+        self.title_length = None
+        self.description_length = None
+        self.title_contains_money = None
+        self.description_contains_money = None
+
+    def enrich(self, now):
+        """Computes the publication time, lengths and money flags of the article.
+
+        Args:
+            now (datetime): The reference time the relative article time is resolved against.
+        """
+        self.published = relative_time_to_absolute(self.time, now)
+        self.title_length = len(self.title)
+        self.description_length = len(self.description)
+        self.title_contains_money = contains_money(self.title)
+        self.description_contains_money = contains_money(self.description)
+
+    def to_dict(self):
+        """Returns the article as a JSON-serializable dict, the publication time in ISO format."""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        if self.published is not None:
+            data['published'] = self.published.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds an article from a dict returned by to_dict."""
+        article = cls.__new__(cls)
+        for field in cls.__slots__:
+            setattr(article, field, data.get(field))
+        if article.published is not None:
+            article.published = datetime.fromisoformat(article.published)
+        return article
+
+    def __repr__(self):
+        return f"News(title={self.title}, link={self.link}, source={self.source}, time={self.time}, description={self.description}, image_url={self.image_url})"
+
+
+def enrich_articles(articles, now=None):
+    """Enriches the articles that have not been enriched yet, against one shared reference time.
+
+    Args:
+        articles (list): The News objects to enrich.
+        now (datetime): The reference time, defaults to the current time.
+
+    Returns:
+        list: The same articles.
+    """
+    if now is None:
+        now = datetime.now()
+    for article in articles:
+        if article.published is None:
+            article.enrich(now)
+    return articles
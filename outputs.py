@@ -0,0 +1,279 @@
+import os
+import csv
+import json
+from datetime import datetime
+
+from openpyxl import Workbook
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: the 'parquet' output format is only offered with pyarrow
+    pa = pq = None
+
+HEADER = [
+    'Title', 'Title Length', 'Title Contains Money', 'Link', 'Source', 'Time',
+    'Description', 'Description Length', 'Description Contains Money', 'Image',
+]
+FIELDS = [
+    'title', 'title_length', 'title_contains_money', 'link', 'source', 'time',
+    'description', 'description_length', 'description_contains_money', 'image',
+]
+
+
+def unique_output_path(output_dir, extension, suffix=''):
+    """Returns an unused output file path named after the current date and time."""
+    base_name = datetime.now().strftime('%Y-%m-%d_%H-%M-%S') + suffix
+    output_path = os.path.join(output_dir, f"{base_name}.{extension}")
+    counter = 1
+    while os.path.exists(output_path):
+        output_path = os.path.join(output_dir, f"{base_name}_{counter}.{extension}")
+        counter += 1
+    return output_path
+
+
+def article_row(article):
+    """Returns the output row of an enriched article, in HEADER order."""
+    return [
+        article.title,
+        article.title_length,
+        article.title_contains_money,
+        article.link,
+        article.source,
+        article.published.strftime('%Y-%m-%d %H:%M:%S'),
+        article.description,
+        article.description_length,
+        article.description_contains_money,
+        article.image_url,
+    ]
+
+
+class OutputWriter:
+    """Base class of the streaming result writers.
+
+    Rows are written as articles are passed in, so the output never has to be
+    held in memory as a whole. Subclasses implement write_row and close.
+    """
+
+    extension = None
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, article):
+        """Writes one enriched article."""
+        self.write_row(article_row(article))
+        self.count += 1
+
+    def write_row(self, row):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+
+def sheet_title(name, used_titles):
+    """Returns a valid, unused Excel sheet title for a name (at most 31 characters)."""
+    title = ''.join('_' if char in '[]:*?/\\' else char for char in name).strip("'")[:31] or 'Sheet'
+    candidate = title
+    counter = 1
+    while candidate.lower() in used_titles:
+        suffix = f" ({counter})"
+        candidate = title[:31 - len(suffix)] + suffix
+        counter += 1
+    used_titles.add(candidate.lower())
+    return candidate
+
+
+def write_merged_workbook(path, results):
+    """Writes the articles of several searches into one write-only workbook.
+
+    The 'All' sheet holds every article with a leading Phrase column, followed by
+    one sheet per search phrase.
+
+    Args:
+        path (str): The path of the workbook.
+        results (list): (search phrase, enriched articles) pairs.
+    """
+    workbook = Workbook(write_only=True)
+    used_titles = {'all'}
+    all_sheet = workbook.create_sheet('All')
+    all_sheet.append(['Phrase'] + HEADER)
+    for phrase, articles in results:
+        phrase_sheet = workbook.create_sheet(sheet_title(phrase, used_titles))
+        phrase_sheet.append(HEADER)
+        for article in articles:
+            row = article_row(article)
+            all_sheet.append([phrase] + row)
+            phrase_sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+class XlsxWriter(OutputWriter):
+    """Writes an Excel workbook in openpyxl's write-only mode, which streams rows to disk."""
+
+    extension = 'xlsx'
+
+    def __init__(self, path, sheet_name='Results'):
+        super().__init__(path)
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(sheet_name)
+        self.sheet.append(HEADER)
+
+    def write_row(self, row):
+        self.sheet.append(row)
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+class CsvWriter(OutputWriter):
+    extension = 'csv'
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(HEADER)
+
+    def write_row(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlWriter(OutputWriter):
+    extension = 'jsonl'
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write_row(self, row):
+        self.file.write(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + '\n')
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter(OutputWriter):
+    """Writes a Parquet file in row groups of batch_size rows. Requires pyarrow."""
+
+    extension = 'parquet'
+
+    def __init__(self, path, batch_size=1000):
+        super().__init__(path)
+        self.schema = pa.schema([
+            ('title', pa.string()),
+            ('title_length', pa.int64()),
+            ('title_contains_money', pa.bool_()),
+            ('link', pa.string()),
+            ('source', pa.string()),
+            ('time', pa.string()),
+            ('description', pa.string()),
+            ('description_length', pa.int64()),
+            ('description_contains_money', pa.bool_()),
+            ('image', pa.string()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.batch_size = batch_size
+        self.rows = []
+
+    def write_row(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows as one row group."""
+        if not self.rows:
+            return
+        columns = [list(column) for column in zip(*self.rows)]
+        self.writer.write_table(pa.Table.from_arrays(columns, schema=self.schema))
+        self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+class WorkItemPublisher(OutputWriter):
+    """Publishes articles as output work items in batches, with their images attached as files.
+
+    Each batch becomes one output work item whose payload holds the articles as
+    records keyed by FIELDS, so downstream robots can start on them while the
+    search is still running. Articles already published are skipped, so a retried
+    search does not publish them twice.
+
+    Args:
+        create_output (callable): Creates an output work item from a payload and a list
+            of files, like robocorp.workitems.outputs.create.
+        batch_size (int): The number of articles per work item.
+        pictures_dir (str): The directory holding the downloaded images, or None to attach no files.
+        payload (dict): Fields added to the payload of every batch, such as the search phrase.
+    """
+
+    def __init__(self, create_output, batch_size=50, pictures_dir=None, payload=None):
+        super().__init__(None)
+        self.create_output = create_output
+        self.batch_size = batch_size
+        self.pictures_dir = pictures_dir
+        self.payload = dict(payload or {})
+        self.batches = 0
+        self.published = set()
+        self.records = []
+        self.files = []
+
+    def write(self, article):
+        """Adds one enriched article to the current batch."""
+        if article.link in self.published:
+            return
+        self.published.add(article.link)
+        self.records.append(dict(zip(FIELDS, article_row(article))))
+        if self.pictures_dir and article.image_url:
+            image_path = os.path.join(self.pictures_dir, article.image_url)
+            if os.path.isfile(image_path) and image_path not in self.files:
+                self.files.append(image_path)
+        self.count += 1
+        if len(self.records) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Publishes the pending articles as one work item."""
+        if not self.records:
+            return
+        self.batches += 1
+        payload = dict(self.payload, batch=self.batches, articles=self.records)
+        self.create_output(payload=payload, files=self.files)
+        self.records = []
+        self.files = []
+
+    def close(self):
+        self.flush()
+
+
+WRITERS = {writer.extension: writer for writer in (XlsxWriter, CsvWriter, JsonlWriter)}
+if pa is not None:
+    WRITERS[ParquetWriter.extension] = ParquetWriter
+
+
+def create_writer(output_format, path):
+    """Creates the writer for an output format ('xlsx', 'csv', 'jsonl' or, with pyarrow, 'parquet').
+
+    Raises:
+        ValueError: If the output format is not supported.
+    """
+    if output_format not in WRITERS:
+        if output_format == ParquetWriter.extension:
+            raise ValueError("The 'parquet' output format requires the pyarrow package.")
+        raise ValueError(f"Unsupported output format: {output_format}")
+    return WRITERS[output_format](path)
@@ -0,0 +1,90 @@
+"""Runs several searches at once, each in its own process with its own headless browser."""
+import os
+import shutil
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from browser_profiles import get_browser_profile
+from outputs import unique_output_path, write_merged_workbook
+
+
+def run_search(scraper_class, url, search, options, max_retries=5):
+    """Runs one search in a fresh headless browser of the calling worker process.
+
+    This is the process pool's entry point, so it only receives picklable arguments:
+    the scraper class is pickled by reference and the articles are returned as News
+    objects. Like CustomSelenium.open_browser, the browser is always closed afterwards,
+    and the worker's user data directory is removed.
+    A failed attempt is retried with a new scraper, which resumes from its checkpoint.
+
+    Args:
+        scraper_class (type): CustomSelenium or one of its subclasses.
+        url (str): The URL to open.
+        search (dict): The search, with search_phrase, months and optionally max_articles.
+        options (dict): Keyword arguments for the scraper, including browser_profile and output_dir.
+        max_retries (int): The number of attempts before giving up.
+
+    Returns:
+        list: The collected articles.
+    """
+    logger = logging.getLogger(__name__)
+    options = dict(options)
+    profile = get_browser_profile(options.pop('browser_profile', 'fast')).for_worker(os.getpid())
+    profile.headless = True
+
+    try:
+        for attempt in range(max_retries):
+            scraper = scraper_class(browser_profile=profile, **options)
+            try:
+                articles = scraper.scrape(url, search['search_phrase'], search['months'], search.get('max_articles'))
+                scraper.clear_checkpoint()
+                return articles
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed for '{search['search_phrase']}': {e}")
+                if attempt == max_retries - 1:
+                    raise
+            finally:
+                scraper.save_trace()
+                scraper.close_browser()
+    finally:
+        # The worker's user data directory is not covered by the robot process's cleanup
+        if profile.user_data_dir:
+            shutil.rmtree(profile.user_data_dir, ignore_errors=True)
+
+
+def run_searches(scraper_class, url, searches, options, workers=None, max_retries=5):
+    """Fans the searches out over a pool of worker processes and merges the results.
+
+    Args:
+        scraper_class (type): CustomSelenium or one of its subclasses.
+        url (str): The URL to open.
+        searches (list): Dicts with search_phrase, months and optionally max_articles.
+        options (dict): Keyword arguments for the scrapers; output_dir is required,
+            since worker processes cannot look it up themselves.
+        workers (int): The number of worker processes, by default one per CPU core.
+        max_retries (int): The number of attempts per search.
+
+    Returns:
+        tuple: The path of the merged workbook (None if every search failed), the
+            (search phrase, articles) pairs of the successful searches and a dict of
+            the errors of the failed ones by search phrase.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(searches)) or 1
+    results = []
+    errors = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (search['search_phrase'], executor.submit(run_search, scraper_class, url, search, options, max_retries))
+            for search in searches
+        ]
+        # Keep the workbook in the order of the payload
+        for phrase, future in futures:
+            try:
+                results.append((phrase, future.result()))
+            except Exception as e:
+                errors[phrase] = e
+
+    output_path = None
+    if results:
+        output_path = write_merged_workbook(unique_output_path(options['output_dir'], 'xlsx', '_merged'), results)
+    return output_path, results, errors
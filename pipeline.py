@@ -0,0 +1,107 @@
+"""Pipelined search mode: paging, image downloads and writing run at the same time."""
+import asyncio
+import logging
+import threading
+
+from outputs import create_writer
+
+_DONE = object()  # Marks the end of a queue's stream
+
+
+class ArticlePipeline:
+    """Streams the articles of a search from the browser into the output file.
+
+    Three stages connected by bounded asyncio queues run concurrently:
+
+    - the browser stage pages through the results in a worker thread and puts each
+      article on the first queue as soon as it is extracted;
+    - image consumers await the article's download on the scraper's ImageDownloader
+      and enrich it;
+    - the writer stage writes each row as soon as its article is complete, and passes
+      the article on to the scraper's sinks.
+
+    A stage waits when the queue it feeds is full, so however many results there are,
+    at most about two queues' worth of articles are in flight. Rows are written in
+    completion order, not in results page order.
+
+    Args:
+        scraper (CustomSelenium): The scraper, with the results page already open.
+        queue_size (int): The capacity of each queue.
+        consumers (int): The number of concurrent image consumers.
+    """
+
+    def __init__(self, scraper, queue_size=64, consumers=8):
+        self.logger = logging.getLogger(__name__)
+        self.scraper = scraper
+        self.queue_size = queue_size
+        self.consumers = consumers
+        self._stopped = threading.Event()
+
+    async def run(self, output_path, months=None, max_articles=None):
+        """Runs the pipeline until every article is written.
+
+        Written articles are also appended to scraper.articles. If a stage fails, the
+        error is raised and the other stages are cancelled when the event loop closes.
+
+        Returns:
+            int: The number of rows written.
+        """
+        collected = asyncio.Queue(self.queue_size)
+        enriched = asyncio.Queue(self.queue_size)
+        now = self.scraper.reference_time
+        stages = [self.produce(collected, months, max_articles), self.write(enriched, output_path)]
+        stages += [self.consume(collected, enriched, now) for _ in range(self.consumers)]
+        try:
+            results = await asyncio.gather(*stages)
+        except BaseException:
+            # Stop the browser thread at its next article instead of paging on
+            self._stopped.set()
+            raise
+        return results[1]
+
+    async def produce(self, collected, months, max_articles):
+        """Browser stage: runs iter_articles in a thread and queues the articles."""
+        loop = asyncio.get_running_loop()
+
+        def collect():
+            for article in self.scraper.iter_articles(months, max_articles, schedule_images=False):
+                if self._stopped.is_set():
+                    return
+                # Blocks the browser thread while the queue is full
+                asyncio.run_coroutine_threadsafe(collected.put(article), loop).result()
+
+        await asyncio.to_thread(collect)
+        for _ in range(self.consumers):
+            await collected.put(_DONE)
+
+    async def consume(self, collected, enriched, now):
+        """Image stage: waits for each article's image download and enriches the article."""
+        while True:
+            article = await collected.get()
+            if article is _DONE:
+                await enriched.put(_DONE)
+                return
+            future = self.scraper.submit_image_download(article, article.image_source)
+            if future is not None:
+                image_file_name = await asyncio.wrap_future(future)
+                if image_file_name:
+                    article.image_url = image_file_name
+                else:
+                    self.logger.warning(f"Failed to download image from URL: {article.image_source}")
+            article.enrich(now)
+            await enriched.put(article)
+
+    async def write(self, enriched, output_path):
+        """Writer stage: streams the enriched articles to the output file."""
+        remaining = self.consumers
+        with create_writer(self.scraper.output_format, output_path) as writer:
+            while remaining:
+                article = await enriched.get()
+                if article is _DONE:
+                    remaining -= 1
+                    continue
+                writer.write(article)
+                for sink in self.scraper.sinks:
+                    sink.write(article)
+                self.scraper.articles.append(article)
+        return writer.count
@@ -0,0 +1,71 @@
+"""Parsing of the Yahoo News search results markup, shared by the browser and HTTP backends.
+
+Only depends on lxml, so the parsing can be used and tested without the browser stack.
+"""
+from lxml import html
+
+RESULTS_XPATH = '//ol[@class="mb-15 reg searchCenterMiddle"]'
+ARTICLES_XPATH = RESULTS_XPATH + '//li//div[@class="dd NewsArticle"]'
+TITLE_XPATH = './/h4[@class="s-title fz-16 lh-20"]/a'
+SOURCE_XPATH = './/span[@class="s-source mr-5 cite-co"]'
+TIME_XPATH = './/span[@class="fc-2nd s-time mr-8"]'
+DESCRIPTION_XPATH = './/p[@class="s-desc"]'
+IMAGE_XPATH = './/a[@class="thmb "]/img'
+NEXT_PAGE_XPATH = '//div[contains(@class, "compPagination")]//a[contains(@class, "next")]'
+
+
+def _first(element, xpath):
+    nodes = element.xpath(xpath)
+    return nodes[0] if nodes else None
+
+
+def _text(element, xpath):
+    node = _first(element, xpath)
+    if node is None:
+        return None
+    return ' '.join(node.text_content().split()) or None
+
+
+def _image_url(element):
+    image = _first(element, IMAGE_XPATH)
+    if image is None:
+        return None
+    src = image.get('src')
+    if src and src.startswith('http'):
+        return src
+    return image.get('data-src') or src
+
+
+def parse_results_page(page_html, base_url=None):
+    """Parses a Yahoo News search results page.
+
+    Uses the same XPaths as the browser backend, so the extracted fields match
+    what CustomSelenium reads from the rendered page.
+
+    Args:
+        page_html (str): The HTML of the results page.
+        base_url (str): The URL the page was loaded from, used to resolve relative links.
+
+    Returns:
+        tuple: The list of article dicts (title, link, source, time, description and
+        image_url keys) and the URL of the next results page, or None on the last page.
+    """
+    tree = html.fromstring(page_html)
+    if base_url:
+        tree.make_links_absolute(base_url)
+
+    articles = []
+    for element in tree.xpath(ARTICLES_XPATH):
+        title = _first(element, TITLE_XPATH)
+        articles.append({
+            'title': title.get('title') if title is not None else None,
+            'link': title.get('href') if title is not None else None,
+            'source': _text(element, SOURCE_XPATH),
+            'time': _text(element, TIME_XPATH),
+            'description': _text(element, DESCRIPTION_XPATH),
+            'image_url': _image_url(element),
+        })
+
+    next_link = _first(tree, NEXT_PAGE_XPATH)
+    next_url = next_link.get('href') if next_link is not None else None
+    return articles, next_url
@@ -1,32 +1,197 @@
 import time
-from robocorp.tasks import task
+from robocorp.tasks import task, get_output_dir
 from custom import CustomSelenium
+from http_backend import HttpNewsScraper
+from article_index import INDEX_MODES
+from browser_profiles import BROWSER_PROFILES
+from browser_service import PAYLOAD_SETTINGS, BrowserService
+from outputs import WRITERS, WorkItemPublisher
+from parallel import run_searches
 from robocorp import workitems
 
+HOME_URL = 'https://news.yahoo.com/'
+
+BACKENDS = {
+    'selenium': CustomSelenium,
+    'http': HttpNewsScraper,
+}
+
 @task
 def minimal_task():
     max_retries = 5  # Number of retries in case of failure
     start_time = time.time()
+    scrapers = {}  # One scraper per backend, browser profile and service, reused by the work items asking for them
+    browser_services = {}  # Warm browser services by profile and settings, shared by the work items using them
+    processed = 0
+
+    try:
+        for item in workitems.inputs:
+            item_start_time = time.time()
+            payload = item.payload if isinstance(item.payload, dict) else {}
+
+            search_phrase = payload.get('search_phrase', 'car sale increase')
+            months = payload.get('months', 1)
+            max_articles = payload.get('max_articles')
+            backend = payload.get('backend', 'selenium')
+            navigation = payload.get('navigation', 'direct')
+            output_format = payload.get('output_format', 'xlsx')
+            index_mode = payload.get('index')
+            browser_profile = payload.get('browser_profile', 'fast')
+            pipeline = payload.get('pipeline', False)
+            # true, or the BrowserService settings listed in PAYLOAD_SETTINGS
+            service_settings = payload.get('browser_service')
+            # Publish the articles as output work items in batches of this size. Batches go out
+            # while the search runs only in pipeline mode, which batch_size therefore turns on.
+            # The 'full' index mode always runs sequentially and publishes once the results are saved.
+            # Pipeline mode keeps no checkpoint, so a failed attempt starts the search over.
+            batch_size = payload.get('batch_size')
+            if batch_size:
+                pipeline = True
+            if backend not in BACKENDS:
+                item.fail(exception_type='BUSINESS', code='UNKNOWN_BACKEND', message=f"Unknown backend: {backend}")
+                processed += 1
+                continue
+            if browser_profile not in BROWSER_PROFILES:
+                item.fail(exception_type='BUSINESS', code='UNKNOWN_BROWSER_PROFILE', message=f"Unknown browser profile: {browser_profile}")
+                processed += 1
+                continue
+            if output_format not in WRITERS:
+                item.fail(exception_type='BUSINESS', code='UNSUPPORTED_OUTPUT_FORMAT', message=f"Unsupported output format: {output_format} (available: {', '.join(WRITERS)})")
+                processed += 1
+                continue
+            if index_mode is not None and index_mode not in INDEX_MODES:
+                item.fail(exception_type='BUSINESS', code='UNKNOWN_INDEX_MODE', message=f"Unknown index mode: {index_mode} (available: {', '.join(INDEX_MODES)})")
+                processed += 1
+                continue
+            browser_service = None
+            if service_settings:
+                settings = service_settings if isinstance(service_settings, dict) else {}
+                invalid = sorted(
+                    name for name, value in settings.items()
+                    if name not in PAYLOAD_SETTINGS or not isinstance(value, (int, float)) or isinstance(value, bool)
+                )
+                if invalid:
+                    item.fail(exception_type='BUSINESS', code='INVALID_BROWSER_SERVICE', message=f"Invalid browser service settings: {', '.join(invalid)}")
+                    processed += 1
+                    continue
+                service_key = (browser_profile, tuple(sorted(settings.items())))
+                if service_key not in browser_services:
+                    browser_services[service_key] = BrowserService(profile=browser_profile, **settings)
+                browser_service = browser_services[service_key]
+
+            # A list of searches is fanned out over a pool of browser worker processes
+            searches = payload.get('searches')
+            if searches is None and isinstance(search_phrase, list):
+                searches = search_phrase
+            if searches is not None:
+                # The workers write one merged workbook and publish nothing while searching
+                unsupported = [
+                    name for name, value in (
+                        ('output_format', output_format != 'xlsx'), ('pipeline', pipeline), ('batch_size', batch_size)
+                    ) if value
+                ]
+                if unsupported:
+                    item.fail(exception_type='BUSINESS', code='UNSUPPORTED_SEARCHES_OPTION', message=f"Not supported with several searches: {', '.join(unsupported)}")
+                    processed += 1
+                    continue
+                # Each search may be a phrase or a dict overriding months and max_articles
+                searches = [search if isinstance(search, dict) else {'search_phrase': search} for search in searches]
+                searches = [{'months': months, 'max_articles': max_articles, **search} for search in searches]
+                options = {
+                    'navigation': navigation,
+                    'index_mode': index_mode,
+                    'browser_profile': browser_profile,
+                    'browser_service': browser_service,
+                    'output_dir': str(get_output_dir()),
+                }
+                output_path, results, errors = run_searches(
+                    BACKENDS[backend], HOME_URL, searches, options, payload.get('workers'), max_retries
+                )
+                item_time = time.time() - item_start_time
+                for phrase, error in errors.items():
+                    print(f"Search '{phrase}' failed: {error}")
+                if output_path:
+                    workitems.outputs.create(
+                        payload={
+                            'searches': [search['search_phrase'] for search in searches],
+                            'articles': {phrase: len(articles) for phrase, articles in results},
+                            'failed': list(errors),
+                        },
+                        files=[output_path],
+                    )
+                    item.done()
+                    print(f"{len(results)} of {len(searches)} searches completed in {item_time:.2f} seconds.")
+                else:
+                    item.fail(exception_type='APPLICATION', code='SEARCH_FAILED', message='; '.join(
+                        f"{phrase}: {error}" for phrase, error in errors.items()
+                    ) or 'No searches given')
+                    print(f"All searches failed after {item_time:.2f} seconds.")
+                processed += 1
+                continue
+
+            # The browser profile and service are only applied when the browser is launched
+            scraper_key = (backend, browser_profile, browser_service)
+            output_path = None
+            error = None
+            publisher = None
+            if batch_size:
+                publisher = WorkItemPublisher(
+                    workitems.outputs.create,
+                    batch_size=batch_size,
+                    payload={'search_phrase': search_phrase, 'months': months},
+                )
+            for attempt in range(max_retries):
+                if scraper_key not in scrapers:
+                    scrapers[scraper_key] = BACKENDS[backend](browser_profile=browser_profile, browser_service=browser_service)
+                selenium = scrapers[scraper_key]
+                selenium.navigation = navigation
+                selenium.output_format = output_format
+                selenium.index_mode = index_mode
+                selenium.pipeline = pipeline
+                if publisher:
+                    publisher.pictures_dir = selenium.pictures_dir
+                    selenium.sinks = [publisher]
+                try:
+                    output_path = selenium.search(HOME_URL, search_phrase, months, max_articles)
+                    break
+                except Exception as e:
+                    error = e
+                    print(f"Attempt {attempt + 1} failed for '{search_phrase}': {e}")
+                    # Start the next attempt from a fresh browser session. It resumes from the search's
+                    # checkpoint, except in pipeline mode, which has none and starts the search over
+                    scrapers.pop(scraper_key).close_browser()
+                    if attempt == max_retries - 1:
+                        print("Max retries reached. Search failed.")
+
+            if publisher:
+                publisher.close()
+                if scraper_key in scrapers:
+                    scrapers[scraper_key].sinks = []
+                print(f"Published {publisher.count} articles in {publisher.batches} work items.")
+
+            item_time = time.time() - item_start_time
+            if output_path:
+                workitems.outputs.create(
+                    payload={
+                        'search_phrase': search_phrase,
+                        'months': months,
+                        'articles': len(selenium.articles),
+                    },
+                    files=[output_path],
+                )
+                item.done()
+                print(f"Search '{search_phrase}' completed in {attempt + 1} attempts and {item_time:.2f} seconds.")
+            else:
+                item.fail(exception_type='APPLICATION', code='SEARCH_FAILED', message=str(error))
+                print(f"Search '{search_phrase}' failed after {item_time:.2f} seconds.")
+            processed += 1
+    finally:
+        for selenium in scrapers.values():
+            selenium.close_browser()
 
-    item = workitems.inputs
-    payload = item.current.payload if item.current else None
-    
-    search_phrase = payload.get('search_phrase', 'car sale increase') if payload else 'car sale increase'
-    months = payload.get('months', 1) if payload else 1
-    
-    for attempt in range(max_retries):
-        try:
-            selenium = CustomSelenium()
-            selenium.open_browser('https://news.yahoo.com/', search_phrase, months)
-            # print("Done.")
-            break  
-        except Exception as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            if attempt == max_retries - 1:
-                print("Max retries reached. Task failed.")
     end_time = time.time()
     total_time = end_time - start_time
-    print(f"Task completed in {attempt + 1} attempts and {total_time:.2f} seconds.")
+    print(f"Task processed {processed} work items in {total_time:.2f} seconds.")
 
 if __name__ == "__main__":
     minimal_task()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules live at the repository root, which robot.yaml puts on the PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
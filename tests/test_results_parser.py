@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from results_parser import parse_results_page
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+BASE_URL = 'https://news.search.yahoo.com/search?p=electric+cars&b=11'
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as file:
+        return file.read()
+
+
+@pytest.fixture
+def middle_page():
+    return parse_results_page(load_fixture('results_page_middle.html'), base_url=BASE_URL)
+
+
+def test_parses_every_article_in_page_order(middle_page):
+    articles, _ = middle_page
+    assert [article['title'] for article in articles] == [
+        'EV sales climb to $1,200,000 in March',
+        'Charging network expands to rural towns',
+        'Battery plant breaks ground',
+    ]
+
+
+def test_parses_article_fields(middle_page):
+    article = middle_page[0][0]
+    assert article == {
+        'title': 'EV sales climb to $1,200,000 in March',
+        'link': 'https://www.reuters.com/business/autos/ev-sales-1',
+        'source': 'Reuters',
+        'time': '· 3 hours ago',
+        'description': 'Electric car sales rose sharply in March, dealers said.',
+        'image_url': 'https://s.yimg.com/fz/api/res/1.2/ev-sales.jpg',
+    }
+
+
+def test_falls_back_to_data_src_for_lazy_loaded_images(middle_page):
+    assert middle_page[0][1]['image_url'] == 'https://s.yimg.com/fz/api/res/1.2/charging.jpg'
+
+
+def test_article_without_thumbnail_has_no_image(middle_page):
+    assert middle_page[0][2]['image_url'] is None
+
+
+def test_makes_relative_links_absolute(middle_page):
+    assert middle_page[0][1]['link'] == 'https://news.search.yahoo.com/news/charging-network-2'
+
+
+def test_keeps_relative_links_without_base_url():
+    articles, next_url = parse_results_page(load_fixture('results_page_middle.html'))
+    assert articles[1]['link'] == '/news/charging-network-2'
+    assert next_url == '/search?p=electric+cars&b=21'
+
+
+def test_next_page_url_on_middle_page(middle_page):
+    assert middle_page[1] == 'https://news.search.yahoo.com/search?p=electric+cars&b=21'
+
+
+def test_no_next_page_url_on_last_page():
+    articles, next_url = parse_results_page(load_fixture('results_page_last.html'), base_url=BASE_URL)
+    assert [article['source'] for article in articles] == ['CNBC']
+    assert articles[0]['time'] == '· 2 months ago'
+    assert next_url is None
+
+
+def test_page_without_articles():
+    assert parse_results_page(load_fixture('results_page_empty.html'), base_url=BASE_URL) == ([], None)
@@ -0,0 +1,110 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+class Span:
+    """A timed stage of a run, with the counters recorded while it was the innermost open span."""
+
+    def __init__(self, name, start, depth):
+        self.name = name
+        self.start = start
+        self.depth = depth
+        self.duration = None
+        self.counters = {}
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'start_seconds': round(self.start, 6),
+            'duration_seconds': round(self.duration, 6) if self.duration is not None else None,
+            'counters': dict(self.counters),
+        }
+
+
+class Tracer:
+    """Records timed spans for the stages of a run and counters attributed to them.
+
+    Spans can be nested; counters go to the innermost open span. Counters may be
+    incremented from worker threads, such as the image downloader's.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._open = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        """Times the enclosed block as a span named after the stage."""
+        with self._lock:
+            span = Span(name, time.perf_counter() - self.origin, len(self._open))
+            self.spans.append(span)
+            self._open.append(span)
+        try:
+            yield span
+        finally:
+            with self._lock:
+                span.duration = time.perf_counter() - self.origin - span.start
+                self._open.remove(span)
+
+    def count(self, counter, amount=1):
+        """Adds to a counter of the innermost open span; ignored when no span is open."""
+        with self._lock:
+            if self._open:
+                counters = self._open[-1].counters
+                counters[counter] = counters.get(counter, 0) + amount
+
+    def totals(self):
+        """Returns every counter summed over all spans."""
+        totals = {}
+        for span in self.spans:
+            for counter, value in span.counters.items():
+                totals[counter] = totals.get(counter, 0) + value
+        return totals
+
+    def to_chrome_trace(self):
+        """Returns the spans in the Chrome trace event format (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        events = [
+            {
+                'name': span.name,
+                'cat': 'stage',
+                'ph': 'X',
+                'ts': round(span.start * 1e6),
+                'dur': round((span.duration or 0) * 1e6),
+                'pid': pid,
+                'tid': 1,
+                'args': dict(span.counters),
+            }
+            for span in self.spans
+        ]
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'spans': [span.as_dict() for span in self.spans],
+            'totals': self.totals(),
+        }
+
+    def save(self, path):
+        """Writes the trace as JSON to the given path."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_chrome_trace(), file, indent=2)
+        return path
+
+
+def count_webdriver_commands(driver, on_command):
+    """Wraps a WebDriver so on_command is called with the name of every command it sends."""
+    if getattr(driver, '_counted_execute', False):
+        return
+    execute = driver.execute
+
+    def counted_execute(driver_command, params=None):
+        on_command(driver_command)
+        return execute(driver_command, params)
+
+    driver.execute = counted_execute
+    driver._counted_execute = True
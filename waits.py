@@ -0,0 +1,129 @@
+import logging
+import random
+import time
+from collections import namedtuple
+
+WaitRecord = namedtuple('WaitRecord', ['description', 'elapsed', 'attempts', 'succeeded'])
+
+
+class WaitScheduler:
+    """Shared wait/retry scheduler for browser interactions.
+
+    Conditions are polled quickly at first and then with jittered exponential
+    backoff, so fast pages are detected within a fraction of a second while slow
+    ones are not hammered. All waits of a run share one deadline budget instead of
+    nesting their own timeouts, and the time each wait actually took is recorded.
+    """
+
+    def __init__(self, budget=300, initial_interval=0.1, max_interval=2.0, factor=2.0, jitter=0.25):
+        self.logger = logging.getLogger(__name__)
+        self.budget = budget
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+        self.deadline = None
+        self.records = []
+
+    def start(self, budget=None):
+        """Starts a new run with a fresh deadline and an empty record."""
+        self.deadline = time.monotonic() + (budget if budget is not None else self.budget)
+        self.records = []
+
+    def remaining(self):
+        """Returns the seconds left in the run's budget, or infinity if no run was started."""
+        if self.deadline is None:
+            return float('inf')
+        return max(0.0, self.deadline - time.monotonic())
+
+    def intervals(self, initial_interval=None):
+        """Yields jittered, exponentially growing sleep intervals."""
+        interval = initial_interval if initial_interval is not None else self.initial_interval
+        while True:
+            yield interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            interval = min(interval * self.factor, self.max_interval)
+
+    def _record(self, description, start_time, attempts, succeeded):
+        record = WaitRecord(description, time.monotonic() - start_time, attempts, succeeded)
+        self.records.append(record)
+        return record
+
+    def wait_until(self, condition, timeout, description, error=None):
+        """Polls a condition until it returns a truthy value.
+
+        Args:
+            condition (function): The condition to poll. Exceptions count as not met.
+            timeout (float): The maximum time to wait, in seconds, capped by the run's budget.
+            description (str): A description of the wait, used in the record and logs.
+            error (str): The message of the AssertionError raised on timeout.
+
+        Returns:
+            The truthy value returned by the condition.
+
+        Raises:
+            AssertionError: If the condition is not met within the timeout.
+        """
+        start_time = time.monotonic()
+        end_time = start_time + min(timeout, self.remaining())
+        attempts = 0
+        for interval in self.intervals():
+            attempts += 1
+            try:
+                result = condition()
+            except Exception:
+                result = None
+            if result:
+                record = self._record(description, start_time, attempts, True)
+                self.logger.debug(f"{description}: done after {record.elapsed:.2f} seconds.")
+                return result
+            now = time.monotonic()
+            if now >= end_time:
+                record = self._record(description, start_time, attempts, False)
+                raise AssertionError(error or f"{description}: not done after {record.elapsed:.2f} seconds.")
+            time.sleep(min(interval, end_time - now))
+
+    def retry(self, func, attempts=3, initial_interval=None, description=None):
+        """Calls a function until it succeeds, backing off between attempts.
+
+        Args:
+            func (function): The function to call.
+            attempts (int): The maximum number of attempts.
+            initial_interval (float): The first backoff interval, in seconds.
+            description (str): A description of the action, defaults to the function name.
+
+        Returns:
+            The result of the function.
+
+        Raises:
+            Exception: The last error, once the attempts or the run's budget are exhausted.
+        """
+        description = description or func.__name__
+        start_time = time.monotonic()
+        intervals = self.intervals(initial_interval)
+        for attempt in range(1, attempts + 1):
+            try:
+                self.logger.info(f"Attempt {attempt} of {attempts} for {description}.")
+                result = func()
+                record = self._record(description, start_time, attempt, True)
+                self.logger.info(f"Attempt {attempt} successful after {record.elapsed:.2f} seconds.")
+                return result
+            except Exception as e:
+                self.logger.error(f"Error on attempt {attempt} for {description}: {e}")
+                delay = next(intervals)
+                if attempt == attempts or delay >= self.remaining():
+                    self._record(description, start_time, attempt, False)
+                    self.logger.error(f"Giving up on {description} after {attempt} attempts.")
+                    raise
+                self.logger.info(f"Retrying after {delay:.2f} seconds...")
+                time.sleep(delay)
+
+    def log_summary(self):
+        """Logs how long each recorded wait took."""
+        for record in self.records:
+            status = 'done' if record.succeeded else 'failed'
+            self.logger.info(
+                f"Wait '{record.description}' {status} in {record.elapsed:.2f} seconds "
+                f"({record.attempts} attempts)."
+            )
+        total = sum(record.elapsed for record in self.records)
+        self.logger.info(f"Total time spent waiting: {total:.2f} seconds.")